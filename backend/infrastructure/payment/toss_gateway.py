@@ -2,61 +2,86 @@
 import base64
 import hashlib
 import hmac
-import uuid
+import secrets
 from datetime import datetime, timedelta
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 import httpx
 from loguru import logger
 from config import settings
 
 
+# 요청마다 클라이언트를 만들면 매번 TCP+TLS 핸드셰이크가 발생하므로
+# 프로세스 전체에서 keep-alive 커넥션 풀을 공유한다.
+_http_client: Optional[httpx.AsyncClient] = None
+
+# 서명 검증용 시크릿 키 (요청마다 인코딩하지 않도록 한 번만 변환)
+_SECRET_KEY_BYTES = settings.TOSS_SECRET_KEY.encode()
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=30,
+            limits=httpx.Limits(max_keepalive_connections=32),
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """공유 HTTP 클라이언트 종료 (앱 종료 시 호출)"""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
 class TossPayments:
     def __init__(self):
         self.client_key = settings.TOSS_CLIENT_KEY
         self.secret_key = settings.TOSS_SECRET_KEY
         self.api_url = settings.TOSS_API_URL
+        # 인증 헤더는 시크릿 키로만 결정되므로 한 번만 만든다
+        encoded_secret = base64.b64encode(f"{self.secret_key}:".encode()).decode()
+        self._headers = {"Authorization": f"Basic {encoded_secret}", "Content-Type": "application/json"}
 
     def _get_headers(self) -> Dict[str, str]:
-        encoded_secret = base64.b64encode(f"{self.secret_key}:".encode()).decode()
-        return {"Authorization": f"Basic {encoded_secret}", "Content-Type": "application/json"}
+        return self._headers
 
     async def confirm_payment(self, payment_key: str, order_id: str, amount: int) -> Dict[str, Any]:
         url = f"{self.api_url}/payments/confirm"
         payload = {"paymentKey": payment_key, "orderId": order_id, "amount": amount}
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.post(url, headers=self._get_headers(), json=payload, timeout=30)
-                response.raise_for_status()
-                return response.json()
-            except httpx.HTTPStatusError as e:
-                logger.error(f"Toss 결제 승인 실패: {e.response.text}")
-                raise Exception(f"결제 승인 실패: {e.response.text}")
+        try:
+            response = await _get_http_client().post(url, headers=self._get_headers(), json=payload)
+            response.raise_for_status()
+            return response.json()
+        except httpx.HTTPStatusError as e:
+            logger.error(f"Toss 결제 승인 실패: {e.response.text}")
+            raise Exception(f"결제 승인 실패: {e.response.text}")
 
     async def get_payment(self, payment_key: str) -> Dict[str, Any]:
         url = f"{self.api_url}/payments/{payment_key}"
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(url, headers=self._get_headers(), timeout=30)
-                response.raise_for_status()
-                return response.json()
-            except httpx.HTTPStatusError as e:
-                logger.error(f"Toss 결제 조회 실패: {e.response.text}")
-                raise Exception(f"결제 조회 실패: {e.response.text}")
+        try:
+            response = await _get_http_client().get(url, headers=self._get_headers())
+            response.raise_for_status()
+            return response.json()
+        except httpx.HTTPStatusError as e:
+            logger.error(f"Toss 결제 조회 실패: {e.response.text}")
+            raise Exception(f"결제 조회 실패: {e.response.text}")
 
     async def cancel_payment(self, payment_key: str, cancel_reason: str) -> Dict[str, Any]:
         url = f"{self.api_url}/payments/{payment_key}/cancel"
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.post(url, headers=self._get_headers(), json={"cancelReason": cancel_reason}, timeout=30)
-                response.raise_for_status()
-                return response.json()
-            except httpx.HTTPStatusError as e:
-                logger.error(f"Toss 결제 취소 실패: {e.response.text}")
-                raise Exception(f"결제 취소 실패: {e.response.text}")
+        try:
+            response = await _get_http_client().post(url, headers=self._get_headers(), json={"cancelReason": cancel_reason})
+            response.raise_for_status()
+            return response.json()
+        except httpx.HTTPStatusError as e:
+            logger.error(f"Toss 결제 취소 실패: {e.response.text}")
+            raise Exception(f"결제 취소 실패: {e.response.text}")
 
     @staticmethod
     def verify_signature(payload: str, signature: str) -> bool:
-        expected = hmac.new(settings.TOSS_SECRET_KEY.encode(), payload.encode(), hashlib.sha256).hexdigest()
+        expected = hmac.new(_SECRET_KEY_BYTES, payload.encode(), hashlib.sha256).hexdigest()
         return hmac.compare_digest(expected, signature)
 
 
@@ -67,7 +92,7 @@ class PaymentService:
     @staticmethod
     def generate_order_id() -> str:
         timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
-        unique = uuid.uuid4().hex[:8]
+        unique = secrets.token_hex(4)
         return f"ORD-{timestamp}-{unique}"
 
     def get_plan_info(self, plan_type) -> Dict[str, Any]:
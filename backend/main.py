@@ -13,6 +13,7 @@ from loguru import logger
 
 from config import settings
 from infrastructure.persistence.database import init_db
+from infrastructure.payment.toss_gateway import close_http_client
 
 # 로깅 설정
 os.makedirs("./logs", exist_ok=True)
@@ -32,6 +33,7 @@ async def lifespan(app: FastAPI):
     logger.info("데이터베이스 초기화 완료")
     yield
     logger.info("서비스 종료...")
+    await close_http_client()
 
 
 # FastAPI 앱 생성
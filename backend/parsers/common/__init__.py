@@ -14,3 +14,4 @@ from parsers.common.text_utils import (
     to_dict,
 )
 from parsers.common.cancellation import CancellationDetector
+from parsers.common.masking import mask_name, mask_owner
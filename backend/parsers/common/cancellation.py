@@ -1,15 +1,20 @@
 """붉은 선/글자 기반 말소 감지"""
-from typing import Dict, List, Tuple, Set
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from typing import Dict, List, Tuple
 
 
 class CancellationDetector:
     """페이지별 붉은 선/글자 기반 말소 감지"""
 
     def __init__(self):
-        # page_index -> set of y-coordinate ranges that are cancelled
+        # page_index -> merged (겹치지 않는, 정렬된) y-coordinate ranges that are cancelled
         self._cancelled_y_ranges: Dict[int, List[Tuple[float, float]]] = {}
-        # page_index -> set of cancelled char y-coords
-        self._cancelled_char_ys: Dict[int, Set[float]] = {}
+        # page_index -> 위 범위의 시작/끝 좌표 (행마다 bisect로 조회)
+        self._range_starts: Dict[int, List[float]] = {}
+        self._range_ends: Dict[int, List[float]] = {}
+        # page_index -> sorted cancelled char y-coords
+        self._cancelled_char_ys: Dict[int, List[float]] = {}
 
     def analyze_page(self, page, page_index: int):
         """페이지의 붉은 선, 붉은 사각형, 붉은 글자 분석"""
@@ -21,46 +26,55 @@ class CancellationDetector:
                 y = round(line['top'], 0)
                 red_line_ys.add(y)
 
+        ranges = [(y - 6, y + 6) for y in red_line_ys]  # 선 위아래 6pt 범위
+
         # 붉은 사각형(박스형 말소 표시) 수집
         for rect in (page.rects or []):
             color = rect.get('stroking_color') or rect.get('non_stroking_color')
             if self._is_red(color):
                 top = round(rect['top'], 0)
                 bottom = round(rect['bottom'], 0)
-                # 사각형의 전체 높이 범위를 말소 영역으로 등록
-                for y in range(int(top), int(bottom) + 1):
-                    red_line_ys.add(float(y))
+                # 사각형의 전체 높이 범위(위아래 6pt 포함)를 하나의 말소 구간으로 등록
+                if bottom >= top:
+                    ranges.append((top - 6, bottom + 6))
 
-        if red_line_ys:
-            ranges = []
-            for y in sorted(red_line_ys):
-                ranges.append((y - 6, y + 6))  # 선 위아래 6pt 범위
-            self._cancelled_y_ranges[page_index] = self._merge_ranges(ranges)
+        if ranges:
+            merged = self._merge_ranges(ranges)
+            self._cancelled_y_ranges[page_index] = merged
+            self._range_starts[page_index] = [start for start, _ in merged]
+            self._range_ends[page_index] = [end for _, end in merged]
 
         # 붉은 글자 y좌표 수집
         red_char_ys = set()
+        is_red = self._is_red_cached
         for ch in (page.chars or []):
             sc = ch.get('stroking_color')
             nsc = ch.get('non_stroking_color')
-            if self._is_red(sc) or self._is_red(nsc):
+            try:
+                red = is_red(sc) or is_red(nsc)
+            except TypeError:  # list 등 해시 불가 색상
+                red = self._is_red(sc) or self._is_red(nsc)
+            if red:
                 red_char_ys.add(round(ch['top'], 0))
         if red_char_ys:
-            self._cancelled_char_ys[page_index] = red_char_ys
+            self._cancelled_char_ys[page_index] = sorted(red_char_ys)
 
     def is_row_cancelled(self, page_index: int, row_y: float) -> bool:
         """해당 페이지의 y좌표가 말소 영역인지 확인"""
         y = round(row_y, 0)
 
-        # 붉은 선 범위 체크
-        ranges = self._cancelled_y_ranges.get(page_index, [])
-        for y_min, y_max in ranges:
-            if y_min <= y <= y_max:
+        # 붉은 선 범위 체크 — 시작이 y 이하인 마지막 범위만 보면 됨
+        starts = self._range_starts.get(page_index)
+        if starts:
+            idx = bisect_right(starts, y) - 1
+            if idx >= 0 and self._range_ends[page_index][idx] >= y:
                 return True
 
-        # 붉은 글자 y좌표 체크
-        char_ys = self._cancelled_char_ys.get(page_index, set())
-        for cy in char_ys:
-            if abs(cy - y) <= 6:
+        # 붉은 글자 y좌표 체크 — y-6 이상인 첫 좌표가 y+6 이내인지
+        char_ys = self._cancelled_char_ys.get(page_index)
+        if char_ys:
+            idx = bisect_left(char_ys, y - 6)
+            if idx < len(char_ys) and char_ys[idx] <= y + 6:
                 return True
 
         return False
@@ -74,16 +88,18 @@ class CancellationDetector:
         top = round(y_top, 0)
         bot = round(y_bot, 0)
 
-        # 붉은 선 범위가 행과 겹치는지
-        ranges = self._cancelled_y_ranges.get(page_index, [])
-        for y_min, y_max in ranges:
-            if y_min <= bot and y_max >= top:
+        # 붉은 선 범위가 행과 겹치는지 — 끝이 top 이상인 첫 범위만 보면 됨
+        ends = self._range_ends.get(page_index)
+        if ends:
+            idx = bisect_left(ends, top)
+            if idx < len(ends) and self._range_starts[page_index][idx] <= bot:
                 return True
 
         # 붉은 글자가 행 y 범위 내에 있는지
-        char_ys = self._cancelled_char_ys.get(page_index, set())
-        for cy in char_ys:
-            if top <= cy <= bot:
+        char_ys = self._cancelled_char_ys.get(page_index)
+        if char_ys:
+            idx = bisect_left(char_ys, top)
+            if idx < len(char_ys) and char_ys[idx] <= bot:
                 return True
 
         return False
@@ -118,15 +134,23 @@ class CancellationDetector:
                     return True
         return False
 
+    # 페이지당 수천 개의 글자가 소수의 색상 튜플을 공유하므로 색상별 판정 결과를 캐시
+    _is_red_cached = staticmethod(lru_cache(maxsize=256)(_is_red.__func__))
+
     @staticmethod
     def _merge_ranges(ranges: List[Tuple[float, float]]) -> List[Tuple[float, float]]:
         if not ranges:
             return []
-        sorted_ranges = sorted(ranges)
-        merged = [sorted_ranges[0]]
-        for start, end in sorted_ranges[1:]:
-            if start <= merged[-1][1]:
-                merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        # 현재 구간을 지역 변수로 들고 가며 끝날 때만 튜플을 만든다
+        it = iter(sorted(ranges))
+        cur_start, cur_end = next(it)
+        merged = []
+        for start, end in it:
+            if start <= cur_end:
+                if end > cur_end:
+                    cur_end = end
             else:
-                merged.append((start, end))
+                merged.append((cur_start, cur_end))
+                cur_start, cur_end = start, end
+        merged.append((cur_start, cur_end))
         return merged
@@ -0,0 +1,19 @@
+"""데모 마스킹 공통 유틸리티"""
+from typing import Any, Dict
+
+
+def mask_name(name: str) -> str:
+    """이름 가운데 글자를 '*'로 가림 (홍길동 → 홍*동, 홍길 → 홍*)"""
+    if len(name) > 2:
+        return name[0] + '*' * (len(name) - 2) + name[-1]
+    return name[0] + '*'
+
+
+def mask_owner(owner: Dict[str, Any]) -> Dict[str, Any]:
+    """소유자 정보(이름/주민번호/주소)를 가린 사본 반환 (원본은 변경하지 않음)"""
+    masked = dict(owner)
+    if masked.get('name'):
+        masked['name'] = mask_name(masked['name'])
+    masked['resident_number'] = '******-*******'
+    masked['address'] = '***' if masked.get('address') else None
+    return masked
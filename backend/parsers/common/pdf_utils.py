@@ -1,6 +1,6 @@
 """PDF 처리 공통 유틸리티 (pdfplumber 기반)"""
 import re
-from typing import Optional
+from typing import Dict, List, Optional
 
 
 WATERMARK_RE = re.compile(r'열\s*람\s*용')
@@ -12,7 +12,8 @@ def is_watermark_char(obj: dict) -> bool:
         return False
     color = obj.get('non_stroking_color')
     if isinstance(color, (tuple, list)) and len(color) >= 3:
-        return all(0.5 < c < 1.0 for c in color[:3])
+        # 페이지의 모든 문자마다 호출되므로 슬라이스 + all(제너레이터) 대신 직접 비교
+        return 0.5 < color[0] < 1.0 and 0.5 < color[1] < 1.0 and 0.5 < color[2] < 1.0
     return False
 
 
@@ -25,9 +26,60 @@ def clean_text(text: Optional[str]) -> str:
     """텍스트 정리 (공백 정규화, 워터마크 제거)"""
     if not text:
         return ""
-    text = WATERMARK_RE.sub('', text)
-    text = re.sub(r'\s+', ' ', text).strip()
-    return text
+    # 워터마크는 항상 '열'로 시작하므로 없으면 정규식을 건너뜀
+    if '열' in text:
+        text = WATERMARK_RE.sub('', text)
+    # re.sub(r'\s+', ' ', text).strip()과 동일 (split()도 같은 유니코드 공백 기준)
+    return ' '.join(text.split())
+
+
+def compact_text(text: Optional[str]) -> str:
+    """워터마크와 모든 공백을 제거한 텍스트 (clean_text(text).replace(' ', '')와 동일)"""
+    if not text:
+        return ""
+    if '열' in text:
+        text = WATERMARK_RE.sub('', text)
+    return "".join(text.split())
+
+
+class _TableCharsPage:
+    """Table.extract()가 참조하는 page.chars만 제공하는 대리 페이지"""
+    __slots__ = ('chars',)
+
+    def __init__(self, chars: List[dict]):
+        self.chars = chars
+
+
+def restrict_to_table(table):
+    """표 영역 안의 문자만 보는 pdfplumber Table 사본 (extract() 결과는 원본과 동일)
+
+    Table.extract()는 행마다 페이지 전체 문자를 다시 훑는다. 문자 중점이 표 bbox
+    안에 있는 것만 한 번 걸러 두면, 이후 행/셀 할당은 표 영역 문자만 훑는다.
+    (pdfplumber도 문자 중점으로 셀을 판정하며, 행/셀 bbox는 표 bbox 안에 있다)
+    """
+    x0, top, x1, bottom = table.bbox
+    chars = [
+        c for c in table.page.chars
+        if x0 <= (c['x0'] + c['x1']) / 2 <= x1 and top <= (c['top'] + c['bottom']) / 2 <= bottom
+    ]
+    return type(table)(_TableCharsPage(chars), table.cells)
+
+
+def extract_first_row(table) -> Optional[List[Optional[str]]]:
+    """pdfplumber Table의 첫 행만 추출 (table.extract()[0]과 동일한 결과)
+
+    Table.extract()는 행마다 페이지 전체 문자를 다시 훑으므로, 섹션 판별에 필요한
+    헤더 행은 첫 행 셀만으로 만든 Table에서 뽑아 건너뛸 표의 전체 추출을 피한다.
+    행이 없으면 None.
+    """
+    rows = table.rows
+    if not rows:
+        return None
+    cells = rows[0].cells
+    # 한 행의 셀은 top이 같으므로 첫 행 셀만으로 만든 Table은 정확히 한 행이 된다
+    first_row = type(table)(table.page, [c for c in cells if c is not None])
+    texts = iter(first_row.extract()[0])
+    return [None if c is None else next(texts) for c in cells]
 
 
 def clean_cell(cell: Optional[str]) -> str:
@@ -35,3 +87,14 @@ def clean_cell(cell: Optional[str]) -> str:
     if not cell:
         return ""
     return cell.strip()
+
+
+def join_cell_parts(cells: List[Optional[str]], pending: Dict[int, List[str]]):
+    """연속 행에서 모은 셀 조각을 줄바꿈으로 이어 셀에 반영하고 비움
+
+    연속 행마다 셀 문자열에 += 하면 여러 줄 항목에서 앞부분을 매번 다시 복사하므로,
+    조각을 리스트로 모았다가 항목이 끝날 때 한 번만 join한다.
+    """
+    for i, parts in pending.items():
+        cells[i] = '\n'.join(parts)
+    pending.clear()
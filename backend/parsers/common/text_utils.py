@@ -1,32 +1,54 @@
 """텍스트 파싱 공통 유틸리티"""
 import re
-from typing import Optional, Tuple
+from functools import lru_cache
+from operator import attrgetter
+from typing import Callable, Optional, Tuple
+
+
+# 금액: 금 1,000,000원 / 원정
+_AMOUNT_RE = re.compile(r'금\s*([\d,]+)\s*원정?')
+# 날짜: 2025년 1월 3일 / 2025.01.03 / 2025-01-03
+_DATE_KOREAN_RE = re.compile(r'(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일')
+_DATE_DOT_RE = re.compile(r'(\d{4})\.(\d{1,2})\.(\d{1,2})')
+_DATE_ISO_RE = re.compile(r'(\d{4})-(\d{1,2})-(\d{1,2})')
+# 접수번호: 제12345호
+_RECEIPT_NUMBER_RE = re.compile(r'제?\s*([\d]+호)')
+# 개인: 6자리-7자리(마스킹 포함: *, ○, ● 등)
+_RESIDENT_NUMBER_RE = re.compile(r'(\d{6})-([*○●]{7}|\d{7}|\d{1,6}[*○●]+)')
+# 법인: 6자리-7자리
+_CORPORATE_NUMBER_RE = re.compile(r'(\d{6})-(\d{7})')
+# 법인: 000-00-00000
+_BUSINESS_NUMBER_RE = re.compile(r'(\d{3}-\d{2}-\d{5})')
 
 
 def parse_amount(text: str) -> Optional[int]:
     """금액 문자열을 숫자로 변환 (원정 변형 포함)"""
     if not text:
         return None
-    match = re.search(r'금\s*([\d,]+)\s*원정?', text)
+    match = _AMOUNT_RE.search(text)
     if match:
         return int(match[1].replace(',', ''))
     return None
 
 
 def parse_date_korean(text: str) -> Optional[str]:
-    """한국어 날짜 형식 파싱 (YYYY년MM월DD일, YYYY.MM.DD, YYYY-MM-DD)"""
+    """한국어 날짜 형식 파싱 (YYYY년MM월DD일, YYYY.MM.DD, YYYY-MM-DD)
+
+    형식 우선순위(한국어 > 점 > ISO)를 유지하기 위해 순서대로 검사하되,
+    구분 문자가 없는 형식은 정규식을 돌리지 않는다.
+    """
     if not text:
         return None
     # 한국어 형식
-    match = re.search(r'(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일', text)
+    match = _DATE_KOREAN_RE.search(text) if '년' in text else None
     if match:
         return f"{match[1]}년 {match[2].zfill(2)}월 {match[3].zfill(2)}일"
     # 점 구분 형식 (2025.01.03)
-    match = re.search(r'(\d{4})\.(\d{1,2})\.(\d{1,2})', text)
+    match = _DATE_DOT_RE.search(text) if '.' in text else None
     if match:
         return f"{match[1]}년 {match[2].zfill(2)}월 {match[3].zfill(2)}일"
     # ISO 형식 (2025-01-03)
-    match = re.search(r'(\d{4})-(\d{1,2})-(\d{1,2})', text)
+    match = _DATE_ISO_RE.search(text) if '-' in text else None
     if match:
         return f"{match[1]}년 {match[2].zfill(2)}월 {match[3].zfill(2)}일"
     return None
@@ -39,37 +61,47 @@ def extract_receipt_info(text: str) -> Tuple[str, str]:
     """
     date_str = parse_date_korean(text) or ""
     number_str = ""
-    number_match = re.search(r'제?\s*([\d]+호)', text)
+    number_match = _RECEIPT_NUMBER_RE.search(text)
     if number_match:
         number_str = number_match[1]
     return date_str, number_str
 
 
-def parse_resident_number(text: str) -> Optional[str]:
-    """주민등록번호/법인번호 추출 (*, ○ 마스킹 대응)"""
-    # 개인: 6자리-7자리(마스킹 포함: *, ○, ● 등)
-    match = re.search(r'(\d{6})-([*○●]{7}|\d{7}|\d{1,6}[*○●]+)', text)
+def parse_resident_number(text: str, start: int = 0,
+                          end: Optional[int] = None) -> Optional[str]:
+    """주민등록번호/법인번호 추출 (*, ○ 마스킹 대응)
+
+    start/end: 탐색 범위 — text[start:end]를 잘라 넘기는 것과 같은 결과
+    """
+    if end is None:
+        end = len(text)
+    match = _RESIDENT_NUMBER_RE.search(text, start, end)
     if match:
         return f"{match[1]}-{match[2]}"
-    # 법인: 6자리-7자리
-    match = re.search(r'(\d{6})-(\d{7})', text)
+    match = _CORPORATE_NUMBER_RE.search(text, start, end)
     if match:
         return f"{match[1]}-{match[2]}"
-    # 법인: 000-00-00000
-    match = re.search(r'(\d{3}-\d{2}-\d{5})', text)
+    match = _BUSINESS_NUMBER_RE.search(text, start, end)
     if match:
         return match[1]
     return None
 
 
+@lru_cache(maxsize=None)
+def _dataclass_fields(cls) -> Tuple[Tuple[str, ...], Callable[[object], tuple]]:
+    """데이터클래스 필드 이름과 전체 필드 값을 튜플로 꺼내는 getter (클래스별 1회 생성)"""
+    names = tuple(cls.__dataclass_fields__)
+    if len(names) > 1:
+        return names, attrgetter(*names)
+    # attrgetter는 이름이 하나면 튜플이 아닌 값을 반환하고, 없으면 만들 수 없음
+    return names, lambda obj: tuple(getattr(obj, k) for k in names)
+
+
 def to_dict(obj):
     """데이터클래스를 딕셔너리로 변환"""
-    if hasattr(obj, '__dataclass_fields__'):
-        d = {}
-        for k in obj.__dataclass_fields__:
-            val = getattr(obj, k)
-            d[k] = to_dict(val)
-        return d
+    if hasattr(type(obj), '__dataclass_fields__'):
+        names, getter = _dataclass_fields(type(obj))
+        return {k: to_dict(v) for k, v in zip(names, getter(obj))}
     elif isinstance(obj, list):
         return [to_dict(item) for item in obj]
     elif isinstance(obj, dict):
@@ -7,7 +7,6 @@
 """
 import re
 import io
-import copy
 from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime
 from dataclasses import dataclass, field
@@ -15,24 +14,147 @@ from loguru import logger
 import pdfplumber
 
 from parsers.base import BaseParser, DocumentTypeInfo, ParseResult
-from parsers.common.pdf_utils import filter_watermark, clean_text, clean_cell, WATERMARK_RE
+from parsers.common.pdf_utils import (
+    filter_watermark, clean_text, clean_cell, compact_text, extract_first_row,
+    join_cell_parts, restrict_to_table, WATERMARK_RE,
+)
 from parsers.common.text_utils import (
     parse_amount, parse_date_korean, extract_receipt_info,
     parse_resident_number, to_dict,
 )
 from parsers.common.cancellation import CancellationDetector
+from parsers.common.masking import mask_owner
+
+
+# ==================== 정규식 패턴 ====================
+# 행/항목 단위로 반복 호출되는 패턴은 모듈 로드 시 한 번만 컴파일한다.
+
+# 기본 정보
+_UNIQUE_NUMBER_RE = re.compile(r'고유번호\s*([\d-]+)')
+_PROPERTY_ADDRESS_RE = re.compile(r'\[(?:토지|건물|집합건물)\]\s*([^\n]+)')
+
+# 표제부
+_ROAD_ADDRESS_RE = re.compile(
+    r'\[도로명주소\]\s*\n?\s*'
+    r'((?:서울|부산|대구|인천|광주|대전|울산|세종|경기|강원|충북|충남|전북|전남|경북|경남|제주)'
+    r'[^\n\[]{5,})'
+)
+_AREA_RE = re.compile(r'([\d,.]+)\s*㎡')
+_BUILDING_NAME_RE = re.compile(r'(\S+(?:아파트|타워|빌|맨션|주택|빌라|오피스텔|빌딩))')
+_LAND_RIGHT_RATIO_RE = re.compile(r'(\d+)분의\s*([\d.]+)')
+_STRUCTURE_RE = re.compile(
+    r'(철근콘크리트구조|철골철근콘크리트구조|목구조|벽돌구조|'
+    r'블록구조|경량철골구조|철골구조|조적구조|강구조)'
+)
+_ROOF_RE = re.compile(
+    r'((?:철근)?콘크리트\s*지붕|슬래브\s*지붕|기와\s*지붕|'
+    r'스라브\s*지붕|평슬래브\s*지붕|\(철근\)콘크리트지붕)'
+)
+_FLOORS_RE = re.compile(r'(\d+)\s*층\s*(?:아파트|오피스텔|근린|주택|상가|업무|건물)')
+_FLOORS_AFTER_ROOF_RE = re.compile(r'지붕\s*(\d+)\s*층')
+# 층별 면적 (지하층 → 지상층 → 옥탑 순으로 스캔)
+_FLOOR_AREA_RES = (
+    re.compile(r'(지하?\d+층)\s*([\d,.]+)\s*㎡'),
+    re.compile(r'(\d+층)\s*([\d,.]+)\s*㎡'),
+    re.compile(r'(옥탑\d?층?)\s*([\d,.]+)\s*㎡'),
+)
+
+# 갑구/을구 행 필터
+_COLLATERAL_ITEM_RE = re.compile(r'\[(?:토지|건물)\]')
+_CANCELS_RANK_RE = re.compile(r'(\d+(?:-\d+)?)번')
+
+# 등기목적 / 등기원인
+_CANCEL_REG_TYPE_RE = re.compile(r'(\d+(?:-\d+)?번?\S*말소)')
+_COURT_RE = re.compile(r'((?:\S+법원|지방법원)\S*의\s*\S+)')
+
+# 갑구 상세
+_OWNER_SHARE_RE = re.compile(r'지분\s+\d+분의\s+\d+\s+(\S+)\s+([\d]{6}-[\d*○●]{7}|[\d]{6}-[\d]{7})')
+_OWNER_RN_RE = re.compile(r'소유자\s+(\S+)\s+([\d]{6}-[\d*○●]{7}|[\d]{6}-[\d]{7})')
+_OWNER_RE = re.compile(r'소유자\s+(\S+)')
+_TRUSTEE_RE = re.compile(r'수탁자\s+(\S+)')
+_PROVISIONAL_RE = re.compile(r'가등기권자\s+(?:지분\s+\d+분의\s+\d+\s+)?(\S+)')
+_CREDITOR_RE = re.compile(r'채권자\s+(\S+)')
+_RIGHTS_HOLDER_RE = re.compile(r'권리자\s+(\S+)')
+_TRADE_AMOUNT_RE = re.compile(r'거래가액\s*금\s*([\d,]+)\s*원')
+_PRESERVED_RIGHT_RE = re.compile(r'피보전권리\s+(.+?)(?:채권자|금지|$)')
+
+# 을구 상세
+_MAX_CLAIM_RE = re.compile(r'채권최고액\s*금\s*([\d,]+)\s*원')
+_BOND_AMOUNT_RE = re.compile(r'채권액\s*금\s*([\d,]+)\s*원')
+_DEBTOR_RE = re.compile(r'채무자\s+(\S+)')
+_MORTGAGEE_RE = re.compile(r'근저당권자\s+(\S+)')
+_LEASE_DEPOSIT_RE = re.compile(r'임차보증금\s*금\s*([\d,]+)\s*원')
+_JEONSE_RE = re.compile(r'전세금\s*금\s*([\d,]+)\s*원')
+_RENT_RE = re.compile(r'차\s*임\s*금?\s*([\d,]+)\s*원')
+_LESSEE_RE = re.compile(r'임차권자\s+(\S+)')
+_CONTRACT_DATE_RE = re.compile(r'임대차계약일자\s*(\d{4}년\s*\d+월\s*\d+일)')
+_FIXED_DATE_RE = re.compile(r'확정일자\s*(\d{4}년\s*\d+월\s*\d+일)')
+_PURPOSE_RE = re.compile(r'목\s*적\s+(.+?)(?:범\s*위|존속|지\s*료|$)')
+_SCOPE_RE = re.compile(r'범\s*위\s+(.+?)(?:존속|지\s*료|지상권자|$)')
+_DURATION_RE = re.compile(r'존속기간\s+(.+?)(?:지\s*료|지상권자|$)')
+_LAND_RENT_RE = re.compile(r'지\s*료\s+(\S+)')
+_COLLATERAL_LIST_RE = re.compile(r'공동담보목록\s+(\S+)')
+
+# 주소/지분 (역할 키워드 뒤 200자 이내)
+_ADDRESS_CITY_RE = re.compile(
+    r'((?:서울|부산|대구|인천|광주|대전|울산|세종|경기|강원|충청|전라|경상|제주)'
+    r'(?:특별시|광역시|특별자치시|도|특별자치도)?'
+    r'\S*(?:\s+\S+){1,8})'
+)
+_ADDRESS_DISTRICT_RE = re.compile(r'(\S+[군구시읍면동리]\s+\S+(?:\s+\S+){0,6})')
+_SHARE_RE = re.compile(r'(\d+)분의\s*(\d+)')
+
+
+# ==================== 분류 키워드 ====================
+# 앞에 있을수록 우선 (공백 제거한 텍스트에 포함되는지 순서대로 검사)
+
+# 갑구 등기목적
+_REG_TYPES_A = (
+    '소유권보존', '소유권이전', '소유권이전청구권가등기',
+    '가처분', '가압류', '압류',
+    '임의경매개시결정', '강제경매개시결정', '경매개시결정',
+    '등기명의인표시변경', '등기명의인표시경정',
+)
+
+# 을구 등기목적
+_REG_TYPES_B = (
+    '근저당권설정', '근저당권이전', '근저당권변경',
+    '근저당권부채권질권설정',
+    '근질권설정', '저당권설정',
+    '전세권설정', '전세권이전',
+    '주택임차권', '임차권설정',
+    '지상권설정', '지상권이전',
+    '가등기', '등기명의인표시변경',
+)
+
+# 등기원인
+_CAUSES = (
+    '매매', '상속', '증여', '신탁', '경락', '판결', '교환',
+    '협의분할', '법원경매', '공매', '설정계약', '매매예약',
+    '확정채권양도', '면책적인수', '취급지점변경',
+    '해지', '해제', '취하', '취소결정', '압류해제',
+    '확정채무의면책적인수',
+)
+
+# 표제부 건물종류 (앞에 있을수록 우선)
+_BUILDING_TYPES = (
+    '제2종근린생활시설', '제1종근린생활시설',
+    '아파트', '오피스텔', '다세대주택', '다가구주택', '단독주택',
+    '근린생활시설', '상가', '업무시설', '주택',
+    '공장', '창고', '연립주택',
+)
 
 
 # ==================== 데이터 클래스 ====================
 
-@dataclass
+@dataclass(slots=True)
 class FloorArea:
     floor: str
     area: float
     is_excluded: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class OwnerInfo:
     name: str
     resident_number: Optional[str] = None
@@ -40,21 +162,21 @@ class OwnerInfo:
     share: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CreditorInfo:
     name: str
     resident_number: Optional[str] = None
     address: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class LesseeInfo:
     name: str
     resident_number: Optional[str] = None
     address: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class LeaseTermInfo:
     contract_date: Optional[str] = None
     resident_registration_date: Optional[str] = None
@@ -62,7 +184,7 @@ class LeaseTermInfo:
     fixed_date: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class LandTitleEntry:
     """표제부 — 토지의 표시 항목"""
     display_number: str = ""
@@ -74,7 +196,7 @@ class LandTitleEntry:
     is_cancelled: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class BuildingTitleEntry:
     """표제부 — 건물의 표시 항목 (1동 / 전유부분)"""
     display_number: str = ""
@@ -85,7 +207,7 @@ class BuildingTitleEntry:
     is_cancelled: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class LandRightEntry:
     """대지권의 목적인 토지의 표시"""
     display_number: str = ""
@@ -95,7 +217,7 @@ class LandRightEntry:
     cause_and_other: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class ExclusivePartEntry:
     """전유부분의 건물의 표시"""
     display_number: str = ""
@@ -106,7 +228,7 @@ class ExclusivePartEntry:
     is_cancelled: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class LandRightRatioEntry:
     """대지권의 표시"""
     display_number: str = ""
@@ -116,7 +238,7 @@ class LandRightRatioEntry:
     is_cancelled: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class SectionAEntry:
     """갑구 항목"""
     rank_number: str
@@ -138,7 +260,7 @@ class SectionAEntry:
 
 
 
-@dataclass
+@dataclass(slots=True)
 class SectionBEntry:
     """을구 항목"""
     rank_number: str
@@ -173,7 +295,7 @@ class SectionBEntry:
     raw_text: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class TitleInfo:
     """표제부 정보"""
     unique_number: str = ""
@@ -200,7 +322,7 @@ class TitleInfo:
     land_right_ratio_entries: List[LandRightRatioEntry] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class RegistryData:
     """등기부등본 전체 데이터"""
     unique_number: str
@@ -253,6 +375,8 @@ class RegistryPDFParser:
         self.raw_text = ""
         self.normalized_text = ""  # 헤더/푸터 제거된 텍스트 (정규식 추출용)
         self.cancellation_detector = CancellationDetector()
+        # 헤더 텍스트 → 섹션 (페이지마다 같은 컬럼 헤더가 반복됨)
+        self._section_cache: Dict[str, Optional[str]] = {}
 
     def parse(self) -> RegistryData:
         """PDF 파싱 실행"""
@@ -277,12 +401,14 @@ class RegistryPDFParser:
                 # extract()와 rows(y좌표)를 모두 가져옴 — 단일 소스
                 found_tables = clean_page.find_tables()
                 for ft in found_tables:
-                    table = ft.extract()
-                    if not table:
-                        continue
+                    # 첫 행/전체 추출 모두 표 영역 문자만 훑도록 한 번 걸러 둠
+                    ft = restrict_to_table(ft)
 
-                    # 첫 행에서 섹션 감지
-                    header_text = ' '.join(str(c or '') for c in table[0])
+                    # 첫 행에서 섹션 감지 — 건너뛸 표는 전체 extract()를 하지 않음
+                    header_row = extract_first_row(ft)
+                    if header_row is None:
+                        continue
+                    header_text = ' '.join(str(c or '') for c in header_row)
                     detected = self._detect_section(header_text)
                     if detected:
                         if detected == '__skip__':
@@ -291,6 +417,7 @@ class RegistryPDFParser:
                         current_section = detected
 
                     if current_section:
+                        table = ft.extract()
                         if current_section not in all_tables_by_section:
                             all_tables_by_section[current_section] = []
 
@@ -306,14 +433,26 @@ class RegistryPDFParser:
                                 'is_cancelled': is_cancelled,
                             })
 
+                # 페이지 객체(chars/lines/rects)와 레이아웃 캐시는 다음 페이지로
+                # 넘어가기 전에 해제해 다쪽 문서에서 메모리가 누적되지 않게 함
+                page.close()
+
             self.raw_text = '\n'.join(page_texts)
+            # 페이지별 텍스트는 raw_text에 합쳐졌으므로 이후 섹션 파싱 동안 들고 있지 않음
+            del page_texts
 
             # 헤더/푸터 제거한 normalized_text 생성 (정규식 추출용)
+            # 푸터 패턴은 모두 '일시' 또는 '/'를 포함하므로 없는 줄은 검색을 생략
+            header_match = self.HEADER_RE.match
+            footer_search = self.FOOTER_RE.search
             normalized_lines = []
             for line in self.raw_text.split('\n'):
                 stripped = line.strip()
-                if stripped and not self.HEADER_RE.match(stripped) and not self.FOOTER_RE.search(stripped):
-                    normalized_lines.append(line)
+                if not stripped or header_match(stripped):
+                    continue
+                if ('일시' in stripped or '/' in stripped) and footer_search(stripped):
+                    continue
+                normalized_lines.append(line)
             self.normalized_text = '\n'.join(normalized_lines)
 
             # 2. 기본 정보 추출
@@ -356,8 +495,6 @@ class RegistryPDFParser:
                 logger.warning(f"을구 파싱 실패: {e}")
 
             # 4. 텍스트 기반 말소 보강 + 관계 매핑
-            self._apply_text_cancellations(section_a)
-            self._apply_text_cancellations(section_b)
             self._map_cancellations(section_a)
             self._map_cancellations(section_b)
 
@@ -375,7 +512,7 @@ class RegistryPDFParser:
     # ==================== 기본 정보 ====================
 
     def _extract_unique_number(self) -> str:
-        match = re.search(r'고유번호\s*([\d-]+)', self.normalized_text)
+        match = _UNIQUE_NUMBER_RE.search(self.normalized_text)
         return match[1] if match else ""
 
     def _detect_property_type(self) -> str:
@@ -387,8 +524,7 @@ class RegistryPDFParser:
         return 'building'
 
     def _extract_address(self) -> str:
-        pattern = r'\[(?:토지|건물|집합건물)\]\s*([^\n]+)'
-        match = re.search(pattern, self.normalized_text)
+        match = _PROPERTY_ADDRESS_RE.search(self.normalized_text)
         if match:
             addr = match[1].strip()
             addr = WATERMARK_RE.sub('', addr).strip()
@@ -398,14 +534,17 @@ class RegistryPDFParser:
     # ==================== 섹션 감지 ====================
 
     def _detect_section(self, text: str) -> Optional[str]:
+        if text in self._section_cache:
+            return self._section_cache[text]
+        section = None
         text_clean = clean_text(text)
         for key, pattern in self.SECTION_PATTERNS.items():
             if pattern.search(text_clean):
                 # _skip 접두사: 공동담보목록 등 → 현재 섹션 리셋 (None 반환)
-                if key.startswith('_skip'):
-                    return '__skip__'
-                return key
-        return None
+                section = '__skip__' if key.startswith('_skip') else key
+                break
+        self._section_cache[text] = section
+        return section
 
     # ==================== 표제부 파싱 ====================
 
@@ -423,29 +562,18 @@ class RegistryPDFParser:
             self._parse_title_building(info, tables_by_section.get('title_building_1dong', []))
 
         # 도로명주소 — 실제 주소 패턴만 매칭 (시/도/군/구 포함)
-        road_match = re.search(
-            r'\[도로명주소\]\s*\n?\s*'
-            r'((?:서울|부산|대구|인천|광주|대전|울산|세종|경기|강원|충북|충남|전북|전남|경북|경남|제주)'
-            r'[^\n\[]{5,})',
-            self.normalized_text
-        )
+        road_match = _ROAD_ADDRESS_RE.search(self.normalized_text)
         if road_match:
             info.road_address = clean_text(road_match[1])
 
         # 건물종류 (토지는 건물종류 없음)
         if property_type != 'land':
-            type_patterns = [
-                '제2종근린생활시설', '제1종근린생활시설',
-                '아파트', '오피스텔', '다세대주택', '다가구주택', '단독주택',
-                '근린생활시설', '상가', '업무시설', '주택',
-                '공장', '창고', '연립주택',
-            ]
             # 표제부 테이블 텍스트에서만 검색
             title_rows = tables_by_section.get('title_building_1dong', [])
             title_row_text = ' '.join(
                 ' '.join(str(c) for c in r['cells']) for r in title_rows
             )
-            for tp in type_patterns:
+            for tp in _BUILDING_TYPES:
                 if tp in title_row_text:
                     info.building_type = tp
                     break
@@ -476,7 +604,7 @@ class RegistryPDFParser:
             cleaned_type = clean_text(cells[3])
             if cleaned_type:
                 info.land_type = cleaned_type
-            area_match = re.search(r'([\d,.]+)\s*㎡', cells[4] or '')
+            area_match = _AREA_RE.search(cells[4] or '')
             if area_match:
                 info.land_area = area_match[1] + '㎡'
 
@@ -505,8 +633,7 @@ class RegistryPDFParser:
 
             # 건물명
             if cells[2] and not info.building_name:
-                name_match = re.search(r'(\S+(?:아파트|타워|빌|맨션|주택|빌라|오피스텔|빌딩))',
-                                       cells[2])
+                name_match = _BUILDING_NAME_RE.search(cells[2])
                 if name_match:
                     info.building_name = name_match[1]
 
@@ -531,7 +658,7 @@ class RegistryPDFParser:
             info.exclusive_part_entries.append(entry)
 
             # 전유면적
-            area_match = re.search(r'([\d,.]+)\s*㎡', cells[3] or '')
+            area_match = _AREA_RE.search(cells[3] or '')
             if area_match:
                 info.exclusive_area = float(area_match[1].replace(',', ''))
 
@@ -568,7 +695,7 @@ class RegistryPDFParser:
             info.land_right_ratio_entries.append(entry)
 
             # 대지권 비율
-            ratio_match = re.search(r'(\d+)분의\s*([\d.]+)', cells[2] or '')
+            ratio_match = _LAND_RIGHT_RATIO_RE.search(cells[2] or '')
             if ratio_match and not info.land_right_ratio:
                 info.land_right_ratio = f"{ratio_match[1]}분의 {ratio_match[2]}"
 
@@ -577,46 +704,33 @@ class RegistryPDFParser:
         text = clean_text(detail_text)
 
         # 구조
-        structure_match = re.search(
-            r'(철근콘크리트구조|철골철근콘크리트구조|목구조|벽돌구조|'
-            r'블록구조|경량철골구조|철골구조|조적구조|강구조)',
-            text
-        )
+        structure_match = _STRUCTURE_RE.search(text)
         if structure_match:
             info.structure = structure_match[1]
 
         # 지붕
-        roof_match = re.search(
-            r'((?:철근)?콘크리트\s*지붕|슬래브\s*지붕|기와\s*지붕|'
-            r'스라브\s*지붕|평슬래브\s*지붕|\(철근\)콘크리트지붕)',
-            text
-        )
+        roof_match = _ROOF_RE.search(text)
         if roof_match:
             info.roof_type = roof_match[1]
 
         # 층수
-        floors_match = re.search(r'(\d+)\s*층\s*(?:아파트|오피스텔|근린|주택|상가|업무|건물)', text)
+        floors_match = _FLOORS_RE.search(text)
         if not floors_match:
-            floors_match = re.search(r'지붕\s*(\d+)\s*층', text)
+            floors_match = _FLOORS_AFTER_ROOF_RE.search(text)
         if floors_match:
             info.floors = int(floors_match[1])
 
         # 층별 면적
-        area_patterns = [
-            r'(지하?\d+층)\s*([\d,.]+)\s*㎡',
-            r'(\d+층)\s*([\d,.]+)\s*㎡',
-            r'(옥탑\d?층?)\s*([\d,.]+)\s*㎡',
-        ]
         seen_floors = set()
-        for pat in area_patterns:
-            for m in re.finditer(pat, detail_text):
+        for pat in _FLOOR_AREA_RES:
+            for m in pat.finditer(detail_text):
                 floor_name = m[1]
                 area_val = float(m[2].replace(',', ''))
                 if floor_name not in seen_floors:
                     seen_floors.add(floor_name)
-                    excluded = '연면적제외' in detail_text[
-                        max(0, m.start() - 50):m.end() + 50
-                    ]
+                    excluded = detail_text.find(
+                        '연면적제외', max(0, m.start() - 50), m.end() + 50
+                    ) != -1
                     info.areas.append(FloorArea(
                         floor=floor_name, area=area_val, is_excluded=excluded
                     ))
@@ -637,7 +751,7 @@ class RegistryPDFParser:
                 continue
 
             rank = clean_text(cells[0])
-            if not rank or not re.match(r'\d', rank):
+            if not rank or not rank[0].isdecimal():
                 continue
 
             # 공동담보목록/매각물건목록/요약 행 필터링
@@ -646,7 +760,7 @@ class RegistryPDFParser:
             if '등기명의인' in rank:
                 break
             purpose = clean_text(cells[1])
-            if re.match(r'\[(?:토지|건물)\]', purpose):
+            if _COLLATERAL_ITEM_RE.match(purpose):
                 continue
 
             receipt_text = clean_text(cells[2])
@@ -677,7 +791,7 @@ class RegistryPDFParser:
             self._extract_section_a_details(entry, detail_text, cause_text)
 
             # 말소 등기 대상 번호
-            cancels_match = re.search(r'(\d+(?:-\d+)?)번', purpose)
+            cancels_match = _CANCELS_RANK_RE.search(purpose)
             if '말소' in purpose and cancels_match:
                 entry.cancels_rank = cancels_match[1]
 
@@ -697,7 +811,7 @@ class RegistryPDFParser:
                 continue
 
             rank = clean_text(cells[0])
-            if not rank or not re.match(r'\d', rank):
+            if not rank or not rank[0].isdecimal():
                 continue
 
             # 공동담보목록/매각물건목록/요약 행 필터링
@@ -706,7 +820,7 @@ class RegistryPDFParser:
             if '등기명의인' in rank:
                 break
             purpose = clean_text(cells[1])
-            if re.match(r'\[(?:토지|건물)\]', purpose):
+            if _COLLATERAL_ITEM_RE.match(purpose):
                 continue
 
             receipt_text = clean_text(cells[2])
@@ -733,7 +847,7 @@ class RegistryPDFParser:
             self._extract_section_b_details(entry, detail_text, cause_text)
 
             # 말소 대상
-            cancels_match = re.search(r'(\d+(?:-\d+)?)번', purpose)
+            cancels_match = _CANCELS_RANK_RE.search(purpose)
             if '말소' in purpose and cancels_match:
                 entry.cancels_rank = cancels_match[1]
 
@@ -747,53 +861,34 @@ class RegistryPDFParser:
         text = clean_text(text)
         # 말소 패턴 우선
         if '말소' in text:
-            m = re.search(r'(\d+(?:-\d+)?번?\S*말소)', text)
+            m = _CANCEL_REG_TYPE_RE.search(text)
             return m[1] if m else text
-        types = [
-            '소유권보존', '소유권이전', '소유권이전청구권가등기',
-            '가처분', '가압류', '압류',
-            '임의경매개시결정', '강제경매개시결정', '경매개시결정',
-            '등기명의인표시변경', '등기명의인표시경정',
-        ]
-        for t in types:
-            if t in text.replace(' ', ''):
+        compact = compact_text(text)
+        for t in _REG_TYPES_A:
+            if t in compact:
                 return t
         return text[:40] if len(text) > 40 else text
 
     def _classify_reg_type_b(self, text: str) -> str:
         text = clean_text(text)
         if '말소' in text:
-            m = re.search(r'(\d+(?:-\d+)?번?\S*말소)', text)
+            m = _CANCEL_REG_TYPE_RE.search(text)
             return m[1] if m else text
-        types = [
-            '근저당권설정', '근저당권이전', '근저당권변경',
-            '근저당권부채권질권설정',
-            '근질권설정', '저당권설정',
-            '전세권설정', '전세권이전',
-            '주택임차권', '임차권설정',
-            '지상권설정', '지상권이전',
-            '가등기', '등기명의인표시변경',
-        ]
-        for t in types:
-            if t in text.replace(' ', ''):
+        compact = compact_text(text)
+        for t in _REG_TYPES_B:
+            if t in compact:
                 return t
         return text[:40] if len(text) > 40 else text
 
     def _extract_cause(self, text: str) -> str:
         """등기원인 추출"""
         text = clean_text(text)
-        causes = [
-            '매매', '상속', '증여', '신탁', '경락', '판결', '교환',
-            '협의분할', '법원경매', '공매', '설정계약', '매매예약',
-            '확정채권양도', '면책적인수', '취급지점변경',
-            '해지', '해제', '취하', '취소결정', '압류해제',
-            '확정채무의면책적인수',
-        ]
-        for c in causes:
-            if c in text.replace(' ', ''):
+        compact = compact_text(text)
+        for c in _CAUSES:
+            if c in compact:
                 return c
         # 법원 결정 패턴
-        court_match = re.search(r'((?:\S+법원|지방법원)\S*의\s*\S+)', text)
+        court_match = _COURT_RE.search(text)
         if court_match:
             return court_match[1]
         return text[:30] if text else ""
@@ -805,10 +900,7 @@ class RegistryPDFParser:
         full = detail + " " + cause
 
         # 공유자/지분 패턴 (복수 공유자)
-        for m in re.finditer(
-            r'지분\s+\d+분의\s+\d+\s+(\S+)\s+([\d]{6}-[\d*○●]{7}|[\d]{6}-[\d]{7})',
-            full
-        ):
+        for m in _OWNER_SHARE_RE.finditer(full):
             name = m[1]
             rn = m[2]
             addr = self._extract_address_after(full, m.end())
@@ -819,10 +911,7 @@ class RegistryPDFParser:
 
         # 소유자 (단독 소유자 — 지분 없는 경우)
         if not entry.owners:
-            for m in re.finditer(
-                r'소유자\s+(\S+)\s+([\d]{6}-[\d*○●]{7}|[\d]{6}-[\d]{7})',
-                full
-            ):
+            for m in _OWNER_RN_RE.finditer(full):
                 name = m[1]
                 rn = m[2]
                 addr = self._extract_address_after(full, m.end())
@@ -833,7 +922,7 @@ class RegistryPDFParser:
 
         # 소유자 (주민번호 없는 패턴 — 법인 등)
         if not entry.owners:
-            owner_match = re.search(r'소유자\s+(\S+)', full)
+            owner_match = _OWNER_RE.search(full)
             if owner_match:
                 name = owner_match[1]
                 rn = parse_resident_number(full)
@@ -845,7 +934,7 @@ class RegistryPDFParser:
 
         # 수탁자
         if not entry.owners:
-            trustee_match = re.search(r'수탁자\s+(\S+)', full)
+            trustee_match = _TRUSTEE_RE.search(full)
             if trustee_match:
                 name = trustee_match[1]
                 rn = parse_resident_number(full)
@@ -855,29 +944,25 @@ class RegistryPDFParser:
 
         # 가등기권자 (지분 정보가 이름 앞에 올 수 있음)
         if not entry.owners:
-            provisional = re.search(
-                r'가등기권자\s+(?:지분\s+\d+분의\s+\d+\s+)?(\S+)', full
-            )
+            provisional = _PROVISIONAL_RE.search(full)
             if provisional:
                 name = provisional[1]
-                rn = parse_resident_number(full[provisional.start():])
+                rn = parse_resident_number(full, provisional.start())
                 entry.owners.append(OwnerInfo(name=name, resident_number=rn))
 
         # 채권자
-        creditor_match = re.search(r'채권자\s+(\S+)', full)
+        creditor_match = _CREDITOR_RE.search(full)
         if creditor_match:
-            rn = parse_resident_number(
-                full[creditor_match.start():]
-            )
+            rn = parse_resident_number(full, creditor_match.start())
             entry.creditor = CreditorInfo(
                 name=creditor_match[1], resident_number=rn
             )
 
         # 권리자
         if not entry.creditor:
-            rights_match = re.search(r'권리자\s+(\S+)', full)
+            rights_match = _RIGHTS_HOLDER_RE.search(full)
             if rights_match:
-                rn = parse_resident_number(full[rights_match.start():])
+                rn = parse_resident_number(full, rights_match.start())
                 entry.creditor = CreditorInfo(
                     name=rights_match[1], resident_number=rn
                 )
@@ -887,12 +972,12 @@ class RegistryPDFParser:
 
         # 거래가액
         if not entry.claim_amount:
-            trade_match = re.search(r'거래가액\s*금\s*([\d,]+)\s*원', full)
+            trade_match = _TRADE_AMOUNT_RE.search(full)
             if trade_match:
                 entry.claim_amount = int(trade_match[1].replace(',', ''))
 
         # 피보전권리
-        right_match = re.search(r'피보전권리\s+(.+?)(?:채권자|금지|$)', full)
+        right_match = _PRESERVED_RIGHT_RE.search(full)
         if right_match and not entry.registration_cause:
             entry.registration_cause = clean_text(right_match[1])
 
@@ -903,61 +988,60 @@ class RegistryPDFParser:
         full = detail + " " + cause
 
         # 채권최고액
-        entry.max_claim_amount = parse_amount(
-            re.search(r'채권최고액\s*금\s*([\d,]+)\s*원', full)[0]
-        ) if re.search(r'채권최고액\s*금\s*([\d,]+)\s*원', full) else None
+        max_claim = _MAX_CLAIM_RE.search(full)
+        entry.max_claim_amount = int(max_claim[1].replace(',', '')) if max_claim else None
 
         # 채권액 (질권 등)
         if not entry.max_claim_amount:
-            bond = re.search(r'채권액\s*금\s*([\d,]+)\s*원', full)
+            bond = _BOND_AMOUNT_RE.search(full)
             if bond:
                 entry.bond_amount = int(bond[1].replace(',', ''))
 
         # 채무자
-        debtor_match = re.search(r'채무자\s+(\S+)', full)
+        debtor_match = _DEBTOR_RE.search(full)
         if debtor_match:
-            rn = parse_resident_number(full[debtor_match.start():])
+            rn = parse_resident_number(full, debtor_match.start())
             addr = self._extract_address_after(full, debtor_match.end())
             entry.debtor = OwnerInfo(
                 name=debtor_match[1], resident_number=rn, address=addr
             )
 
         # 근저당권자
-        mortgagee_match = re.search(r'근저당권자\s+(\S+)', full)
+        mortgagee_match = _MORTGAGEE_RE.search(full)
         if mortgagee_match:
-            rn = parse_resident_number(full[mortgagee_match.start():])
+            rn = parse_resident_number(full, mortgagee_match.start())
             entry.mortgagee = CreditorInfo(
                 name=mortgagee_match[1], resident_number=rn
             )
 
         # 채권자 (질권 등)
         if not entry.mortgagee:
-            creditor_match = re.search(r'채권자\s+(\S+)', full)
+            creditor_match = _CREDITOR_RE.search(full)
             if creditor_match:
-                rn = parse_resident_number(full[creditor_match.start():])
+                rn = parse_resident_number(full, creditor_match.start())
                 entry.mortgagee = CreditorInfo(
                     name=creditor_match[1], resident_number=rn
                 )
 
         # 임차보증금
-        deposit = re.search(r'임차보증금\s*금\s*([\d,]+)\s*원', full)
+        deposit = _LEASE_DEPOSIT_RE.search(full)
         if deposit:
             entry.deposit_amount = int(deposit[1].replace(',', ''))
 
         # 전세금
-        jeonse = re.search(r'전세금\s*금\s*([\d,]+)\s*원', full)
+        jeonse = _JEONSE_RE.search(full)
         if jeonse and not entry.deposit_amount:
             entry.deposit_amount = int(jeonse[1].replace(',', ''))
 
         # 차임(월세)
-        rent = re.search(r'차\s*임\s*금?\s*([\d,]+)\s*원', full)
+        rent = _RENT_RE.search(full)
         if rent:
             entry.monthly_rent = int(rent[1].replace(',', ''))
 
         # 임차권자
-        lessee_match = re.search(r'임차권자\s+(\S+)', full)
+        lessee_match = _LESSEE_RE.search(full)
         if lessee_match:
-            rn = parse_resident_number(full[lessee_match.start():])
+            rn = parse_resident_number(full, lessee_match.start())
             entry.lessee = LesseeInfo(
                 name=lessee_match[1], resident_number=rn
             )
@@ -965,30 +1049,30 @@ class RegistryPDFParser:
         # 임대차 기간
         if '임대차계약일자' in full or '확정일자' in full:
             lt = LeaseTermInfo()
-            contract = re.search(r'임대차계약일자\s*(\d{4}년\s*\d+월\s*\d+일)', full)
+            contract = _CONTRACT_DATE_RE.search(full)
             if contract:
                 lt.contract_date = contract[1]
-            fixed = re.search(r'확정일자\s*(\d{4}년\s*\d+월\s*\d+일)', full)
+            fixed = _FIXED_DATE_RE.search(full)
             if fixed:
                 lt.fixed_date = fixed[1]
             entry.lease_term = lt
 
         # 지상권 정보
-        purpose_match = re.search(r'목\s*적\s+(.+?)(?:범\s*위|존속|지\s*료|$)', full)
+        purpose_match = _PURPOSE_RE.search(full)
         if purpose_match:
             entry.purpose = clean_text(purpose_match[1])
-        scope_match = re.search(r'범\s*위\s+(.+?)(?:존속|지\s*료|지상권자|$)', full)
+        scope_match = _SCOPE_RE.search(full)
         if scope_match:
             entry.scope = clean_text(scope_match[1])
-        duration_match = re.search(r'존속기간\s+(.+?)(?:지\s*료|지상권자|$)', full)
+        duration_match = _DURATION_RE.search(full)
         if duration_match:
             entry.duration = clean_text(duration_match[1])
-        rent_match = re.search(r'지\s*료\s+(\S+)', full)
+        rent_match = _LAND_RENT_RE.search(full)
         if rent_match:
             entry.land_rent = rent_match[1]
 
         # 공동담보
-        collateral = re.search(r'공동담보목록\s+(\S+)', full)
+        collateral = _COLLATERAL_LIST_RE.search(full)
         if collateral:
             if not entry.raw_text:
                 entry.raw_text = ""
@@ -1001,28 +1085,24 @@ class RegistryPDFParser:
         """특정 위치 이후의 주소 추출"""
         remaining = text[pos:pos + 200]
         # 주소 패턴: 시/도로 시작
-        addr_match = re.search(
-            r'((?:서울|부산|대구|인천|광주|대전|울산|세종|경기|강원|충청|전라|경상|제주)'
-            r'(?:특별시|광역시|특별자치시|도|특별자치도)?'
-            r'\S*(?:\s+\S+){1,8})',
-            remaining
-        )
+        addr_match = _ADDRESS_CITY_RE.search(remaining)
         if addr_match:
             return clean_text(addr_match[1])
         # 군/구 시작 패턴
-        addr_match2 = re.search(r'(\S+[군구시읍면동리]\s+\S+(?:\s+\S+){0,6})', remaining)
+        addr_match2 = _ADDRESS_DISTRICT_RE.search(remaining)
         if addr_match2:
             return clean_text(addr_match2[1])
         return None
 
     @staticmethod
     def _extract_share_near(text: str, pos: int) -> Optional[str]:
-        """지분 정보 추출"""
-        nearby = text[max(0, pos - 100):pos + 200]
-        share_match = re.search(r'(\d+)분의\s*(\d+)', nearby)
+        """지분 정보 추출 (pos 앞 100자 ~ 뒤 200자 범위)"""
+        # 공유자마다 호출되므로 범위를 잘라 복사하지 않고 같은 범위를 인덱스로 탐색
+        start, end = max(0, pos - 100), pos + 200
+        share_match = _SHARE_RE.search(text, start, end)
         if share_match:
             return f"{share_match[1]}분의 {share_match[2]}"
-        if '단독소유' in nearby:
+        if text.find('단독소유', start, end) != -1:
             return '단독소유'
         return None
 
@@ -1050,55 +1130,68 @@ class RegistryPDFParser:
     def _merge_continuation_rows(rows: List[Dict]) -> List[Dict]:
         """연속 행 병합 (순위번호가 비어있으면 이전 행에 합침)"""
         merged = []
+        pending: Dict[int, List[str]] = {}
         for row_data in rows:
             cells = row_data['cells']
             rank = clean_text(cells[0]) if cells else ""
 
             # 순위번호가 있으면 새 항목
-            if rank and re.match(r'\d', rank):
+            if rank and rank[0].isdecimal():
+                if pending:
+                    join_cell_parts(merged[-1]['cells'], pending)
                 merged.append(row_data)
             elif merged:
-                # 이전 행에 텍스트 병합
+                # 이전 행에 텍스트 병합 (셀별 조각을 모았다가 다음 항목에서 한 번에 join)
                 prev = merged[-1]
-                for i in range(len(cells)):
-                    if i < len(prev['cells']) and cells[i]:
-                        if prev['cells'][i]:
-                            prev['cells'][i] += '\n' + cells[i]
+                prev_cells = prev['cells']
+                for i in range(min(len(cells), len(prev_cells))):
+                    if cells[i]:
+                        parts = pending.get(i)
+                        if parts is not None:
+                            parts.append(cells[i])
+                        elif prev_cells[i]:
+                            pending[i] = [prev_cells[i], cells[i]]
                         else:
-                            prev['cells'][i] = cells[i]
+                            pending[i] = [cells[i]]
                 # 말소 상태 전파
                 if row_data.get('is_cancelled'):
                     prev['is_cancelled'] = True
 
+        if pending:
+            join_cell_parts(merged[-1]['cells'], pending)
         return merged
 
     # ==================== 말소 처리 ====================
 
-    def _apply_text_cancellations(self, entries: List):
+    @staticmethod
+    def _apply_text_cancellation(entry):
         """텍스트 기반 말소 보강 (붉은 선 감지 못한 경우 대비)"""
-        for entry in entries:
-            raw = entry.raw_text or ""
-            reg_type = entry.registration_type or ""
+        reg_type = entry.registration_type or ""
 
-            # "X번~말소" 등기는 그 자체가 말소 등기
-            if '말소' in reg_type:
-                cancels_match = re.search(r'(\d+(?:-\d+)?)번', reg_type)
-                if cancels_match and not entry.cancels_rank:
-                    entry.cancels_rank = cancels_match[1]
+        # "X번~말소" 등기는 그 자체가 말소 등기
+        if '말소' in reg_type:
+            cancels_match = _CANCELS_RANK_RE.search(reg_type)
+            if cancels_match and not entry.cancels_rank:
+                entry.cancels_rank = cancels_match[1]
 
-            # 등기원인이 해지/해제/취하/취소 → 말소 처리
-            cause = entry.registration_cause or ""
-            if cause in ('해지', '해제', '취하', '취소결정', '압류해제'):
-                if not entry.cancels_rank:
-                    cancels_match = re.search(r'(\d+(?:-\d+)?)번', reg_type)
-                    if cancels_match:
-                        entry.cancels_rank = cancels_match[1]
+        # 등기원인이 해지/해제/취하/취소 → 말소 처리
+        cause = entry.registration_cause or ""
+        if cause in ('해지', '해제', '취하', '취소결정', '압류해제'):
+            if not entry.cancels_rank:
+                cancels_match = _CANCELS_RANK_RE.search(reg_type)
+                if cancels_match:
+                    entry.cancels_rank = cancels_match[1]
 
     def _map_cancellations(self, entries: List):
-        """말소 관계 매핑: 말소등기 → 원본등기"""
+        """말소 관계 매핑: 말소등기 → 원본등기
+
+        말소 대상 순위는 텍스트 보강과 같은 순회에서 모은다. 말소등기는 보통
+        원본등기보다 뒤에 오므로 적용은 두 번째 순회에서 한다.
+        """
         cancel_map: Dict[str, Dict] = {}
 
         for entry in entries:
+            self._apply_text_cancellation(entry)
             if entry.cancels_rank:
                 cancel_map[entry.cancels_rank] = {
                     'rank_number': entry.rank_number,
@@ -1191,31 +1284,28 @@ class RegistryParserV1(BaseParser):
         )
 
     def mask_for_demo(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """등기부등본 전용 데모 마스킹"""
-        masked = copy.deepcopy(data)
+        """등기부등본 전용 데모 마스킹
+
+        원본은 변경하지 않는다. 전체 deepcopy 대신 마스킹으로 값이 바뀌는
+        하위 dict만 복사하고, 나머지(raw_text 등)는 원본과 공유한다.
+        """
+        masked = dict(data)
 
         # 표제부 면적은 첫 층만
         if 'title_info' in masked and 'areas' in masked['title_info']:
+            masked['title_info'] = dict(masked['title_info'])
             masked['title_info']['areas'] = masked['title_info']['areas'][:1]
 
         # 갑구 첫 항목만, 개인정보 마스킹
         if 'section_a' in masked and masked['section_a']:
-            first_entry = masked['section_a'][0]
+            first_entry = dict(masked['section_a'][0])
             if first_entry.get('owner'):
-                owner = first_entry['owner']
-                if owner.get('name'):
-                    name = owner['name']
-                    owner['name'] = (
-                        name[0] + '*' * (len(name) - 2) + name[-1]
-                        if len(name) > 2 else name[0] + '*'
-                    )
-                owner['resident_number'] = '******-*******'
-                owner['address'] = '***' if owner.get('address') else None
+                first_entry['owner'] = mask_owner(first_entry['owner'])
             masked['section_a'] = [first_entry]
 
         # 을구 첫 항목만, 금액 숨김
         if 'section_b' in masked and masked['section_b']:
-            first_entry = masked['section_b'][0]
+            first_entry = dict(masked['section_b'][0])
             first_entry['max_claim_amount'] = None
             first_entry['deposit_amount'] = None
             first_entry['mortgagee'] = None
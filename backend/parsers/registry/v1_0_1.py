@@ -19,7 +19,6 @@ v1.0.0 대비 개선사항:
 from __future__ import annotations
 import re
 import io
-import copy
 import base64
 from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime
@@ -28,24 +27,208 @@ from loguru import logger
 import pdfplumber
 
 from parsers.base import BaseParser, DocumentTypeInfo, ParseResult
-from parsers.common.pdf_utils import filter_watermark, clean_text, clean_cell, WATERMARK_RE
+from parsers.common.pdf_utils import (
+    filter_watermark, clean_text, clean_cell, compact_text, extract_first_row,
+    join_cell_parts, restrict_to_table, WATERMARK_RE,
+)
 from parsers.common.text_utils import (
     parse_amount, parse_date_korean, extract_receipt_info,
     parse_resident_number, to_dict,
 )
 from parsers.common.cancellation import CancellationDetector
+from parsers.common.masking import mask_owner
+
+
+# ==================== 정규식 패턴 ====================
+# 행/항목 단위로 반복 호출되는 패턴은 모듈 로드 시 한 번만 컴파일한다.
+
+# 기본 정보
+_UNIQUE_NUMBER_RE = re.compile(r'고유번호\s*[:：]?\s*([\d\s-]{10,})')
+_LAND_TITLE_RE = re.compile(r'토지의\s*표시')
+_AGGREGATE_TITLE_RE = re.compile(r'전유부분의\s*건물의\s*표시|대지권의\s*표시')
+_BUILDING_TITLE_RE = re.compile(r'1동의\s*건물의\s*표시')
+_PROPERTY_ADDRESS_RE = re.compile(r'\[(?:토지|건물|집합건물)\]\s*([^\n]+)')
+_VIEWED_AT_RE = re.compile(r'열람일시\s*[:：]\s*(.+?)(?:\n|$)')
+_ISSUED_AT_RE = re.compile(r'(?:발행일시|출력일시)\s*[:：]\s*(.+?)(?:\n|$)')
+_KOREAN_DATE_RE = re.compile(r'(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일')
+_KOREAN_TIME_RE = re.compile(r'(오전|오후)?\s*(\d{1,2})시\s*(\d{1,2})분\s*(\d{1,2})초')
+
+# 행 단위 워터마크 ('열/람/용' 분절)
+_WATERMARK_TOKEN_RES = tuple(re.compile(rf'\b{t}\b') for t in ('열', '람', '용'))
+_WATERMARK_LINE_RE = re.compile(r'(?m)^\s*(열|람|용)\s*$')
+_WATERMARK_TRAILING_LINE_RE = re.compile(r'\n\s*(열|람|용)\s*$')
+_WATERMARK_LEADING_LINE_RE = re.compile(r'^\s*(열|람|용)\s*\n')
+_EXCESS_NEWLINES_RE = re.compile(r'\n{3,}')
+
+# 갑구/을구 행 필터
+_COLLATERAL_ITEM_RE = re.compile(r'\[(?:토지|건물)\]')
+_CANCELS_RANK_RE = re.compile(r'(\d+(?:-\d+)?)번')
+
+# 등기목적 / 등기원인
+_CANCEL_REG_TYPE_RE = re.compile(r'(\d+(?:-\d+)?번?\S*말소)')
+_KOREAN_DATE_COMPACT_RE = re.compile(r'\d{4}년\d{1,2}월\d{1,2}일')
+_COURT_RE = re.compile(r'(\w+법원\w*의\w+(?:\([^)]*\))?)')
+
+# 표제부
+_ROAD_ADDRESS_RE = re.compile(
+    r'\[도로명주소\]\s*\n?\s*'
+    r'((?:서울|부산|대구|인천|광주|대전|울산|세종|경기|강원|충북|충남|전북|전남|경북|경남|제주)'
+    r'[^\n\[]{5,})'
+)
+_AREA_RE = re.compile(r'([\d,.]+)\s*㎡')
+_BUILDING_NAME_RE = re.compile(r'(\S+(?:아파트|타워|빌|맨션|주택|빌라|오피스텔|빌딩))')
+_LAND_RIGHT_RATIO_RE = re.compile(r'(\d+)분의\s*([\d.]+)')
+_STRUCTURE_RE = re.compile(
+    r'(철근콘크리트구조|철골철근콘크리트구조|목구조|벽돌구조|'
+    r'블록구조|경량철골구조|철골구조|조적구조|강구조)'
+)
+_ROOF_RE = re.compile(
+    r'((?:철근)?콘크리트\s*지붕|슬래브\s*지붕|기와\s*지붕|'
+    r'스라브\s*지붕|평슬래브\s*지붕|\(철근\)콘크리트지붕)'
+)
+_FLOORS_RE = re.compile(r'(\d+)\s*층\s*(?:아파트|오피스텔|근린|주택|상가|업무|건물)')
+_FLOORS_AFTER_ROOF_RE = re.compile(r'지붕\s*(\d+)\s*층')
+# 층별 면적 — 한 번의 스캔으로 지하/지상/옥탑 층을 모두 찾는다
+# (지하1층/옥탑1층 안의 '1층'이 별도 층으로 다시 매칭되지 않음)
+_FLOOR_AREA_RE = re.compile(r'(지하?\d+층|\d+층|옥탑\d?층?)\s*([\d,.]+)\s*㎡')
+_FLOOR_NUMBER_RE = re.compile(r'\d+')
+
+# 갑구 상세
+_OWNER_SHARE_RE = re.compile(r'지분\s+\d+분의\s+\d+\s+(\S+)\s+([\d]{6}-[\d*]{7}|[\d]{6}-[\d]{7})')
+_OWNER_RN_RE = re.compile(r'소유자\s+(\S+)\s+([\d]{6}-[\d*]{7}|[\d]{6}-[\d]{7})')
+_OWNER_RE = re.compile(r'소유자\s+(\S+)')
+_TRUSTEE_RE = re.compile(r'수탁자\s+(\S+)')
+_PROVISIONAL_RE = re.compile(r'가등기권자\s+(?:지분\s+\d+분의\s+\d+\s+)?(\S+)')
+_CREDITOR_RE = re.compile(r'채권자\s+(\S+)')
+_RIGHTS_HOLDER_RE = re.compile(r'권리자\s+(\S+)')
+_DISPOSITION_OFFICE_RE = re.compile(r'처분청\s+(.+)')
+_TRADE_AMOUNT_RE = re.compile(r'거래가액\s*금\s*([\d,]+)\s*원')
+_PRESERVED_RIGHT_RE = re.compile(r'피보전권리\s+(.+?)(?:채권자|금지|$)')
+
+# 을구 상세
+_MAX_CLAIM_RE = re.compile(r'채권최고액\s*금\s*([\d,]+)\s*원')
+_BOND_AMOUNT_RE = re.compile(r'채권액\s*금\s*([\d,]+)\s*원')
+_DEBTOR_RE = re.compile(r'채무자\s+(\S+)')
+_DEBTOR_STOP_RE = re.compile(r'근저당권자|저당권자|채권자|권리자|전세권자|임차권자|지상권자')
+_MORTGAGEE_RE = re.compile(r'근저당권자\s+(\S+)')
+_LEASE_DEPOSIT_RE = re.compile(r'임차보증금\s*금\s*([\d,]+)\s*원')
+_JEONSE_RE = re.compile(r'전세금\s*금\s*([\d,]+)\s*원')
+_RENT_RE = re.compile(r'차\s*임\s*금?\s*([\d,]+)\s*원')
+_LESSEE_RE = re.compile(r'임차권자\s+(\S+)')
+_CONTRACT_DATE_RE = re.compile(r'임대차계약일자\s*(\d{4}년\s*\d+월\s*\d+일)')
+_FIXED_DATE_RE = re.compile(r'확정일자\s*(\d{4}년\s*\d+월\s*\d+일)')
+_PURPOSE_RE = re.compile(r'목\s*적\s+(.+?)(?:범\s*위|존속|지\s*료|$)')
+_SCOPE_RE = re.compile(r'범\s*위\s+(.+?)(?:존속|지\s*료|지상권자|$)')
+_DURATION_RE = re.compile(r'존속기간\s+(.+?)(?:지\s*료|지상권자|$)')
+_LAND_RENT_RE = re.compile(r'지\s*료\s+(\S+)')
+_SURFACE_RIGHT_HOLDER_RE = re.compile(r'지상권자\s+(\S+)')
+_COLLATERAL_LIST_RE = re.compile(r'공동담보목록\s+(\S+)')
+
+# 주소/지분 (역할 키워드 뒤 200자 이내)
+_ADDRESS_STOP_RE = re.compile(
+    r'(?:부동산|민법|상법|형법|세법|등기)\S*법\b|제\d+조|규정에\s*의하여|전산이기|'
+    r'매매목록|공동담보목록|\d{4}년\s*\d{1,2}월\s*\d{1,2}일|'
+    r'근저당권자|저당권자|채권자|채무자|소유자|공유자|권리자|'
+    r'임차권자|전세권자|지상권자|가등기권자|수탁자|처분청'
+)
+# 시/도 접미사(특별시, 광역시, 도 …)는 뒤의 \S*가 그대로 흡수하므로 따로 나열하지 않음
+_ADDRESS_CITY_RE = re.compile(
+    r'((?:서울|부산|대구|인천|광주|대전|울산|세종|경기|강원|충청|전라|경상|제주)'
+    r'\S*(?:\s+\S+){1,8})'
+)
+_ADDRESS_DISTRICT_RE = re.compile(r'(\S+[군구시읍면동리]\s+\S+(?:\s+\S+){0,6})')
+_SHARE_RE = re.compile(r'(\d+)분의\s*(\d+)')
+
+# 매매목록
+_LIST_NUMBER_RE = re.compile(r'(\d[\d-]+)')
+
+# 주요 등기사항 요약
+_SUMMARY_UNIQUE_NUMBER_RE = re.compile(r'고유번호\s*[:：]?\s*([\d\s-]+)')
+_SUMMARY_PROPERTY_RE = re.compile(r'\[(토지|건물|집합건물)\]\s*(.+?)(?:\n|$)')
+# 금액 키워드끼리는 서로 겹치지 않으므로 한 번의 스캔으로 키워드별 첫 매칭을 얻는다
+_SUMMARY_AMOUNT_RE = re.compile(r'(채권최고액|채권액|보증금|전세금)\s*(금\s*[\d,]+\s*원)')
+_SUMMARY_AMOUNT_FIELDS = {
+    '채권최고액': 'max_claim_amount',
+    '채권액': 'bond_amount',
+    '보증금': 'deposit_amount',
+    '전세금': 'deposit_amount',
+}
+_SUMMARY_PURPOSE_RE = re.compile(r'목\s*적\s+(.+?)(?:지상권자|전세권자|임차권자|채권자|근저당권자|$)')
+_SUMMARY_CREDITOR_RE = re.compile(
+    r'(?:근저당권자|저당권자|채권자|지상권자|전세권자|임차권자|권리자)\s+(\S+)'
+)
+
+
+# ==================== 분류 키워드 ====================
+# 목록 순서가 곧 우선순위 — 구체적인 키워드를 앞에 둔다 (부분문자열 오인식 방지).
+# 키워드가 짧고 입력도 한 셀 분량이라 C 레벨 `in` 검사가 오토마톤/정규식 스캔보다 빠르다.
+
+# 갑구 등기목적 (소유권이전청구권가등기 > 소유권이전)
+_REG_TYPES_A = (
+    '소유권이전청구권가등기', '소유권보존', '소유권이전',
+    '가처분', '가압류', '압류',
+    '임의경매개시결정', '강제경매개시결정', '경매개시결정',
+    '등기명의인표시변경', '등기명의인표시경정',
+)
+
+# 을구 등기목적
+_REG_TYPES_B = (
+    '근저당권설정', '근저당권이전', '근저당권변경',
+    '근저당권부채권질권설정',
+    '근질권설정', '저당권설정',
+    '전세권설정', '전세권이전',
+    '주택임차권', '임차권설정',
+    '지상권설정', '지상권이전',
+    '가등기', '등기명의인표시변경',
+)
+
+# 등기원인 (매매예약 > 매매, 압류해제 > 해제 등)
+_CAUSES = (
+    '매매예약', '매매', '상속', '증여', '신탁', '경락', '판결', '교환',
+    '협의분할', '법원경매', '공매', '설정계약',
+    '확정채권양도', '확정채무의면책적인수', '면책적인수', '취급지점변경',
+    '압류해제', '압류', '해지', '해제', '취하', '취소결정',
+    '전거', '행정구역변경', '도로명주소변경', '명칭변경', '주소변경',
+)
+
+# 건물 용도 (제2종근린생활시설 > 근린생활시설, 다세대주택 > 주택 등)
+_BUILDING_TYPES = (
+    '제2종근린생활시설', '제1종근린생활시설',
+    '아파트', '오피스텔', '다세대주택', '다가구주택', '단독주택',
+    '근린생활시설', '상가', '업무시설', '주택',
+    '공장', '창고', '연립주택',
+)
+
+# 연속 행 병합 시 걸러낼 타 섹션 컬럼 헤더/타이틀
+_FOREIGN_HEADER_KEYWORDS = (
+    "등기명의인", "순위번호", "주요등기사항", "대상소유자",
+    "공동담보", "매각", "매매", "목록번호", "거래가액",
+)
+
+# 말소 등기로 취급하는 등기원인
+_CANCEL_CAUSES = frozenset(('해지', '해제', '취하', '취소결정', '압류해제'))
+
+# can_parse 판별 키워드와 가중치
+_CAN_PARSE_INDICATORS = (
+    ('고유번호', 0.3),
+    ('표제부', 0.2),
+    ('갑구', 0.2),
+    ('을구', 0.1),
+    ('등기부등본', 0.15),
+    ('[토지]', 0.05), ('[건물]', 0.05), ('[집합건물]', 0.05),
+)
 
 
 # ==================== 데이터 클래스 ====================
 
-@dataclass
+@dataclass(slots=True)
 class FloorArea:
     floor: str                  # 층 정보 (예: '1층', '지하1층')
     area: float                 # 면적 (㎡)
     is_excluded: bool = False   # 제외 면적 여부
 
 
-@dataclass
+@dataclass(slots=True)
 class OwnerInfo:
     name: str                               # 성명 또는 법인명
     resident_number: Optional[str] = None  # 주민/법인등록번호 (마스킹 포함, 예: '650603-*******')
@@ -54,21 +237,21 @@ class OwnerInfo:
     role: Optional[str] = None             # 등기부상 역할: '소유자' | '공유자' | '가등기권자' | '수탁자'
 
 
-@dataclass
+@dataclass(slots=True)
 class CreditorInfo:
     name: str                               # 채권자 성명 또는 법인명
     resident_number: Optional[str] = None  # 주민/법인등록번호
     address: Optional[str] = None          # 주소
 
 
-@dataclass
+@dataclass(slots=True)
 class LesseeInfo:
     name: str                               # 임차인 성명
     resident_number: Optional[str] = None  # 주민등록번호
     address: Optional[str] = None          # 주소
 
 
-@dataclass
+@dataclass(slots=True)
 class LeaseTermInfo:
     contract_date: Optional[str] = None                # 계약일자
     resident_registration_date: Optional[str] = None   # 주민등록일자
@@ -76,7 +259,7 @@ class LeaseTermInfo:
     fixed_date: Optional[str] = None                   # 확정일자
 
 
-@dataclass
+@dataclass(slots=True)
 class LandTitleEntry:
     """표제부 — 토지의 표시 항목"""
     display_number: str = ""    # 표시번호
@@ -88,7 +271,7 @@ class LandTitleEntry:
     is_cancelled: bool = False  # 말소 여부
 
 
-@dataclass
+@dataclass(slots=True)
 class BuildingTitleEntry:
     """표제부 — 건물의 표시 항목"""
     display_number: str = ""        # 표시번호
@@ -99,7 +282,7 @@ class BuildingTitleEntry:
     is_cancelled: bool = False      # 말소 여부
 
 
-@dataclass
+@dataclass(slots=True)
 class LandRightEntry:
     """대지권의 목적인 토지의 표시"""
     display_number: str = ""    # 표시번호
@@ -109,7 +292,7 @@ class LandRightEntry:
     cause_and_other: str = ""   # 등기원인 및 기타사항
 
 
-@dataclass
+@dataclass(slots=True)
 class ExclusivePartEntry:
     """전유부분의 건물의 표시 (집합건물)"""
     display_number: str = ""    # 표시번호
@@ -120,7 +303,7 @@ class ExclusivePartEntry:
     is_cancelled: bool = False  # 말소 여부
 
 
-@dataclass
+@dataclass(slots=True)
 class LandRightRatioEntry:
     """대지권의 표시"""
     display_number: str = ""        # 표시번호
@@ -130,7 +313,7 @@ class LandRightRatioEntry:
     is_cancelled: bool = False      # 말소 여부
 
 
-@dataclass
+@dataclass(slots=True)
 class SectionAEntry:
     """갑구 항목 — 소유권에 관한 사항"""
     rank_number: str            # 순위번호 (예: '1', '1-1', '2'). 부기등기는 '-'로 구분
@@ -154,7 +337,7 @@ class SectionAEntry:
     remarks: Optional[str] = None                   # 기타사항 (법조문·표시변경 내용 등 권리자가 없는 항목의 상세)
 
 
-@dataclass
+@dataclass(slots=True)
 class SectionBEntry:
     """을구 항목 — 소유권 이외의 권리에 관한 사항"""
     rank_number: str            # 순위번호
@@ -192,7 +375,7 @@ class SectionBEntry:
     remarks: Optional[str] = None                   # 기타사항
 
 
-@dataclass
+@dataclass(slots=True)
 class TitleInfo:
     """표제부 정보"""
     unique_number: str = ""         # 고유번호 (예: '1101-2006-000001')
@@ -218,7 +401,7 @@ class TitleInfo:
     land_right_ratio_entries: List[LandRightRatioEntry] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class TradeListItem:
     """매매목록 항목"""
     serial_number: str = ""        # 일련번호
@@ -228,7 +411,7 @@ class TradeListItem:
     correction_cause: str = ""     # 경정원인
 
 
-@dataclass
+@dataclass(slots=True)
 class TradeList:
     """매매목록"""
     list_number: str = ""                              # 목록번호 (예: '2016-553')
@@ -236,7 +419,7 @@ class TradeList:
     items: List[TradeListItem] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class MajorSummaryOwnerEntry:
     """주요 등기사항 요약 - 등기명의인 요약"""
     name: str                                           # 등기명의인 성명
@@ -246,7 +429,7 @@ class MajorSummaryOwnerEntry:
     rank_number: str = ""                                  # 순위번호
 
 
-@dataclass
+@dataclass(slots=True)
 class MajorSummaryRightEntry:
     """주요 등기사항 요약 - 권리사항 요약"""
     rank_number: str            # 순위번호
@@ -263,7 +446,7 @@ class MajorSummaryRightEntry:
     is_cancelled: bool = False             # 말소 여부 (취소선)
 
 
-@dataclass
+@dataclass(slots=True)
 class MajorSummary:
     """주요 등기사항 요약 (참고용)"""
     property_type: str = ""        # 부동산 유형 ('토지', '건물', '집합건물')
@@ -273,7 +456,7 @@ class MajorSummary:
     rights: List[MajorSummaryRightEntry] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class RegistryData:
     """등기부등본 전체 데이터"""
     unique_number: str
@@ -301,9 +484,8 @@ def _strip_watermark_fragments_in_row(cells: List[str]) -> List[str]:
 
     영향 최소화를 위해, 같은 행에서 '열/람/용' 토큰이 2개 이상 감지될 때만 제거한다.
     """
-    tokens = {"열", "람", "용"}
     flat = " ".join((c or "").replace("\n", " ") for c in cells)
-    found = [t for t in tokens if re.search(rf"\b{t}\b", flat)]
+    found = [p for p in _WATERMARK_TOKEN_RES if p.search(flat)]
     if len(found) < 2:
         return cells
 
@@ -314,14 +496,31 @@ def _strip_watermark_fragments_in_row(cells: List[str]) -> List[str]:
             continue
         s = c
         # 줄 단위로 들어간 '열/람/용' 제거
-        s = re.sub(r"(?m)^\s*(열|람|용)\s*$", "", s)
-        s = re.sub(r"\n\s*(열|람|용)\s*$", "", s)
-        s = re.sub(r"^\s*(열|람|용)\s*\n", "", s)
-        s = re.sub(r"\n{3,}", "\n\n", s).strip()
+        s = _WATERMARK_LINE_RE.sub("", s)
+        s = _WATERMARK_TRAILING_LINE_RE.sub("", s)
+        s = _WATERMARK_LEADING_LINE_RE.sub("", s)
+        s = _EXCESS_NEWLINES_RE.sub("\n\n", s).strip()
         cleaned.append(s)
     return cleaned
 
 
+# ==================== 층 정렬 ====================
+
+def _floor_sort_key(area: FloorArea) -> Tuple[int, int, str]:
+    """층 정렬 키: 지하(깊은 층부터) → 지상(낮은 층부터) → 옥탑
+
+    문자열 정렬은 '10층' < '2층' < '지하1층' 순이 되므로 층 번호로 비교한다.
+    """
+    floor = area.floor
+    m = _FLOOR_NUMBER_RE.search(floor)
+    number = int(m[0]) if m else 0
+    if floor.startswith('지'):
+        return (0, -number, floor)
+    if floor.startswith('옥탑'):
+        return (2, number, floor)
+    return (1, number, floor)
+
+
 # ==================== 테이블 행 위치 추출 ====================
 
 def _get_table_row_y_positions(page, table_index: int = 0) -> List[float]:
@@ -406,6 +605,8 @@ class RegistryPDFParser:
         self.pdf_buffer = pdf_buffer
         self.raw_text = ""
         self.cancellation_detector = CancellationDetector()
+        # 헤더 텍스트 → 섹션 (페이지마다 같은 컬럼 헤더가 반복됨)
+        self._section_cache: Dict[str, Optional[str]] = {}
 
     def parse(self) -> RegistryData:
         """PDF 파싱 실행"""
@@ -436,15 +637,19 @@ class RegistryPDFParser:
 
                 if table_objs:
                     for t_obj in table_objs:
-                        table = t_obj.extract()
-                        if not table:
+                        # 첫 행/전체 추출 모두 표 영역 문자만 훑도록 한 번 걸러 둠
+                        t_obj = restrict_to_table(t_obj)
+
+                        # 섹션 판별은 첫 행만으로 하고, 건너뛸 표는 전체 extract()를 하지 않음
+                        header_row = extract_first_row(t_obj)
+                        if header_row is None:
                             continue
 
-                        header_text = " ".join(str(c or "") for c in table[0])
+                        header_text = " ".join([c or "" for c in header_row])
                         detected = self._detect_section(header_text)
 
                         # 컬럼 기반 휴리스틱 (특히 '주요 등기사항 요약' 테이블 등)
-                        detected2 = self._classify_table_by_columns(table[0], header_text, detected or current_section)
+                        detected2 = self._classify_table_by_columns(header_row, header_text, detected or current_section)
                         if detected2:
                             detected = detected2
 
@@ -462,11 +667,14 @@ class RegistryPDFParser:
                             continue
 
                         all_tables_by_section.setdefault(current_section, [])
+                        table = t_obj.extract()
+                        # Table.rows는 접근할 때마다 셀을 다시 정렬/그룹핑하므로 한 번만 계산
+                        table_rows = t_obj.rows
 
                         # 테이블 행에 페이지/말소 정보 추가
                         for ri, row in enumerate(table):
                             try:
-                                row_bbox = t_obj.rows[ri].bbox
+                                row_bbox = table_rows[ri].bbox
                                 row_y = row_bbox[1]      # top
                                 row_y_bot = row_bbox[3]  # bottom
                             except Exception:
@@ -490,7 +698,7 @@ class RegistryPDFParser:
                         if not table:
                             continue
 
-                        header_text = " ".join(str(c or "") for c in table[0])
+                        header_text = " ".join([c or "" for c in table[0]])
                         detected = self._detect_section(header_text)
                         detected2 = self._classify_table_by_columns(table[0], header_text, detected or current_section)
                         if detected2:
@@ -516,7 +724,13 @@ class RegistryPDFParser:
                                 "is_cancelled": False,
                             })
 
+                # 페이지 객체(chars/lines/rects)와 레이아웃 캐시는 다음 페이지로
+                # 넘어가기 전에 해제해 다쪽 문서에서 메모리가 누적되지 않게 함
+                page.close()
+
             self.raw_text = '\n'.join(page_texts)
+            # 페이지별 텍스트는 raw_text에 합쳐졌으므로 이후 섹션 파싱 동안 들고 있지 않음
+            del page_texts
 
             # 2. 기본 정보 추출
             unique_number = self._extract_unique_number()
@@ -548,7 +762,7 @@ class RegistryPDFParser:
             in_trade = False
             for row in section_b_rows:
                 cells = row.get('cells', [])
-                text_compact = ''.join(str(c or '') for c in cells).replace(' ', '')
+                text_compact = ''.join([c or '' for c in cells]).replace(' ', '')
                 if '매매목록' in text_compact:
                     in_trade = True
                 if in_trade:
@@ -572,8 +786,6 @@ class RegistryPDFParser:
             major_summary = self._parse_major_summary_from_tables(owner_rows, right_rows)
 
             # 4. 텍스트 기반 말소 보강 + 관계 매핑
-            self._apply_text_cancellations(section_a)
-            self._apply_text_cancellations(section_b)
             self._map_cancellations(section_a)
             self._map_cancellations(section_b)
 
@@ -630,10 +842,10 @@ class RegistryPDFParser:
 
     def _extract_unique_number(self) -> str:
         # 일부 PDF는 숫자가 공백/줄바꿈으로 분절되어 들어오므로 공백 허용 후 정규화
-        match = re.search(r'고유번호\s*[:：]?\s*([\d\s-]{10,})', self.raw_text)
+        match = _UNIQUE_NUMBER_RE.search(self.raw_text)
         if not match:
             return ""
-        return re.sub(r"\s+", "", match[1])
+        return "".join(match[1].split())
 
     def _detect_property_type(self) -> str:
         first_page = self.raw_text[:1000]
@@ -646,19 +858,18 @@ class RegistryPDFParser:
             return 'building'
 
         # 표제부 키워드 기반 (일부 양식은 상단 표기가 생략됨)
-        if re.search(r'토지의\s*표시', first_page):
+        if _LAND_TITLE_RE.search(first_page):
             return 'land'
-        if re.search(r'전유부분의\s*건물의\s*표시|대지권의\s*표시', first_page):
+        if _AGGREGATE_TITLE_RE.search(first_page):
             return 'aggregate_building'
-        if re.search(r'1동의\s*건물의\s*표시', first_page):
+        if _BUILDING_TITLE_RE.search(first_page):
             return 'building'
 
         # 기본값
         return 'building'
 
     def _extract_address(self) -> str:
-        pattern = r'\[(?:토지|건물|집합건물)\]\s*([^\n]+)'
-        match = re.search(pattern, self.raw_text)
+        match = _PROPERTY_ADDRESS_RE.search(self.raw_text)
         if match:
             addr = match[1].strip()
             addr = WATERMARK_RE.sub('', addr).strip()
@@ -669,10 +880,10 @@ class RegistryPDFParser:
         """열람일시 / 발행일시 추출 (정규화된 형식)"""
         viewed_at = None
         issued_at = None
-        m = re.search(r'열람일시\s*[:：]\s*(.+?)(?:\n|$)', self.raw_text)
+        m = _VIEWED_AT_RE.search(self.raw_text)
         if m:
             viewed_at = self._normalize_timestamp(clean_text(m[1]))
-        m = re.search(r'(?:발행일시|출력일시)\s*[:：]\s*(.+?)(?:\n|$)', self.raw_text)
+        m = _ISSUED_AT_RE.search(self.raw_text)
         if m:
             issued_at = self._normalize_timestamp(clean_text(m[1]))
         return viewed_at, issued_at
@@ -685,8 +896,8 @@ class RegistryPDFParser:
         - '2025년04월01일 13시06분16초'
         - '2025년 4월 1일 오후 1시6분16초'
         """
-        date_match = re.search(r'(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일', text)
-        time_match = re.search(r'(오전|오후)?\s*(\d{1,2})시\s*(\d{1,2})분\s*(\d{1,2})초', text)
+        date_match = _KOREAN_DATE_RE.search(text)
+        time_match = _KOREAN_TIME_RE.search(text)
         if not date_match or not time_match:
             return text
 
@@ -763,14 +974,17 @@ class RegistryPDFParser:
     # ==================== 섹션 감지 ====================
 
     def _detect_section(self, text: str) -> Optional[str]:
+        if text in self._section_cache:
+            return self._section_cache[text]
+        section = None
         text_clean = clean_text(text)
         for key, pattern in self.SECTION_PATTERNS.items():
             if pattern.search(text_clean):
                 # _skip 접두사: 공동담보목록 등 → 현재 섹션 리셋 (None 반환)
-                if key.startswith('_skip'):
-                    return '__skip__'
-                return key
-        return None
+                section = '__skip__' if key.startswith('_skip') else key
+                break
+        self._section_cache[text] = section
+        return section
 
     def _classify_table_by_columns(
         self,
@@ -783,21 +997,17 @@ class RegistryPDFParser:
         일부 페이지(특히 '주요 등기사항 요약')는 표 제목이 테이블에 포함되지 않아,
         컬럼명으로 섹션을 식별해야 한다.
         """
-        cols = " ".join(clean_text(str(c or "")) for c in header_row)
-        cols = re.sub(r"\s+", " ", cols).strip()
-        cols_compact = cols.replace(" ", "")
+        # 공백을 모두 제거한 compact 문자열 하나로 키워드를 검사한다.
+        # ('최종지분'/'대상소유자'/'전유부분'은 각각 '지분'/'대상소유'/'전유'에 포함되므로 생략)
+        cols_compact = "".join([compact_text(c) for c in header_row])
 
         # 주요 등기사항 요약 - 등기명의인 테이블
         # '등기명의인'이 줄바꿈으로 분절되면 '등 기 명 의 인' 형태가 되므로 compact로 매칭
-        if "등기명의인" in cols_compact and (
-            "최종지분" in cols_compact or "지분" in cols_compact or "순위번호" in cols_compact
-        ):
+        if "등기명의인" in cols_compact and ("지분" in cols_compact or "순위번호" in cols_compact):
             return "major_summary_owners"
 
         # 주요 등기사항 요약 - 권리사항 테이블
-        if ("주요등기사항" in cols_compact or "등기목적" in cols_compact) and (
-            "대상소유자" in cols_compact or "대상소유" in cols_compact
-        ):
+        if ("주요등기사항" in cols_compact or "등기목적" in cols_compact) and "대상소유" in cols_compact:
             return "major_summary_rights"
 
         # 컨텍스트가 '주요 등기사항 요약'으로 판별된 상태에서 이어지는 표
@@ -809,7 +1019,7 @@ class RegistryPDFParser:
             return "title_land"
         if "표시번호" in cols_compact and "건물내역" in cols_compact:
             return "title_building_1dong"
-        if "표시번호" in cols_compact and ("전유" in cols_compact or "전유부분" in cols_compact) and "건물내역" in cols_compact:
+        if "표시번호" in cols_compact and "전유" in cols_compact and "건물내역" in cols_compact:
             return "title_exclusive"
 
         return None
@@ -819,13 +1029,16 @@ class RegistryPDFParser:
         owners: List[Dict] = []
         rights: List[Dict] = []
         mode: Optional[str] = None
+        # 보정 루프에서 다시 정리하지 않도록 행별 compact 텍스트를 보관
+        compacts: List[str] = []
 
         for row in rows:
             cells = row.get('cells') or []
-            line = clean_text(" ".join(cells))
-            compact = line.replace(" ", "")
+            compact = compact_text(" ".join(cells))
+            compacts.append(compact)
 
-            if "등기명의인" in compact and ("최종지분" in compact or "지분" in compact or "순위번호" in compact):
+            # '최종지분'은 '지분'에 포함
+            if "등기명의인" in compact and ("지분" in compact or "순위번호" in compact):
                 mode = 'owners'
                 owners.append(row)
                 continue
@@ -842,9 +1055,7 @@ class RegistryPDFParser:
 
         # 헤더 분리가 실패한 경우: row 내 텍스트 특징으로 약한 분류
         if not owners and not rights:
-            for row in rows:
-                cells = row.get('cells') or []
-                compact = clean_text(" ".join(cells)).replace(" ", "")
+            for row, compact in zip(rows, compacts):
                 if "등기명의인" in compact:
                     owners.append(row)
                 elif "등기목적" in compact or "주요등기사항" in compact:
@@ -877,41 +1088,29 @@ class RegistryPDFParser:
 
     def _parse_title(self, tables_by_section: Dict, property_type: str) -> TitleInfo:
         info = TitleInfo()
+        # 1동 건물 표제부는 파싱과 건물종류 검색에 모두 쓰인다
+        title_rows = tables_by_section.get('title_building_1dong', [])
 
         if property_type == 'land':
             self._parse_title_land(info, tables_by_section.get('title_land', []))
         elif property_type == 'aggregate_building':
-            self._parse_title_building(info, tables_by_section.get('title_building_1dong', []))
+            self._parse_title_building(info, title_rows)
             self._parse_title_exclusive(info, tables_by_section.get('title_exclusive', []))
             self._parse_land_right_land(info, tables_by_section.get('land_right_land', []))
             self._parse_land_right_ratio(info, tables_by_section.get('land_right_ratio', []))
         else:
-            self._parse_title_building(info, tables_by_section.get('title_building_1dong', []))
+            self._parse_title_building(info, title_rows)
 
         # 도로명주소 — 실제 주소 패턴만 매칭 (시/도/군/구 포함)
-        road_match = re.search(
-            r'\[도로명주소\]\s*\n?\s*'
-            r'((?:서울|부산|대구|인천|광주|대전|울산|세종|경기|강원|충북|충남|전북|전남|경북|경남|제주)'
-            r'[^\n\[]{5,})',
-            self.raw_text
-        )
+        road_match = _ROAD_ADDRESS_RE.search(self.raw_text)
         if road_match:
             info.road_address = clean_text(road_match[1])
 
         # 건물종류 (토지는 건물종류 없음)
         if property_type != 'land':
-            type_patterns = [
-                '제2종근린생활시설', '제1종근린생활시설',
-                '아파트', '오피스텔', '다세대주택', '다가구주택', '단독주택',
-                '근린생활시설', '상가', '업무시설', '주택',
-                '공장', '창고', '연립주택',
-            ]
             # 표제부 테이블 텍스트에서만 검색
-            title_rows = tables_by_section.get('title_building_1dong', [])
-            title_row_text = ' '.join(
-                ' '.join(str(c) for c in r['cells']) for r in title_rows
-            )
-            for tp in type_patterns:
+            title_row_text = ' '.join([c for r in title_rows for c in r['cells']])
+            for tp in _BUILDING_TYPES:
                 if tp in title_row_text:
                     info.building_type = tp
                     break
@@ -955,7 +1154,7 @@ class RegistryPDFParser:
             cleaned_type = clean_text(land_type)
             if cleaned_type:
                 info.land_type = cleaned_type
-            area_match = re.search(r'([\d,.]+)\s*㎡', area or '')
+            area_match = _AREA_RE.search(area or '')
             if area_match:
                 info.land_area = area_match[1] + '㎡'
 
@@ -984,8 +1183,7 @@ class RegistryPDFParser:
 
             # 건물명
             if cells[2] and not info.building_name:
-                name_match = re.search(r'(\S+(?:아파트|타워|빌|맨션|주택|빌라|오피스텔|빌딩))',
-                                       cells[2])
+                name_match = _BUILDING_NAME_RE.search(cells[2])
                 if name_match:
                     info.building_name = name_match[1]
 
@@ -1010,7 +1208,7 @@ class RegistryPDFParser:
             info.exclusive_part_entries.append(entry)
 
             # 전유면적
-            area_match = re.search(r'([\d,.]+)\s*㎡', cells[3] or '')
+            area_match = _AREA_RE.search(cells[3] or '')
             if area_match:
                 info.exclusive_area = float(area_match[1].replace(',', ''))
 
@@ -1047,7 +1245,7 @@ class RegistryPDFParser:
             info.land_right_ratio_entries.append(entry)
 
             # 대지권 비율
-            ratio_match = re.search(r'(\d+)분의\s*([\d.]+)', cells[2] or '')
+            ratio_match = _LAND_RIGHT_RATIO_RE.search(cells[2] or '')
             if ratio_match and not info.land_right_ratio:
                 info.land_right_ratio = f"{ratio_match[1]}분의 {ratio_match[2]}"
 
@@ -1056,51 +1254,37 @@ class RegistryPDFParser:
         text = clean_text(detail_text)
 
         # 구조
-        structure_match = re.search(
-            r'(철근콘크리트구조|철골철근콘크리트구조|목구조|벽돌구조|'
-            r'블록구조|경량철골구조|철골구조|조적구조|강구조)',
-            text
-        )
+        structure_match = _STRUCTURE_RE.search(text)
         if structure_match:
             info.structure = structure_match[1]
 
         # 지붕
-        roof_match = re.search(
-            r'((?:철근)?콘크리트\s*지붕|슬래브\s*지붕|기와\s*지붕|'
-            r'스라브\s*지붕|평슬래브\s*지붕|\(철근\)콘크리트지붕)',
-            text
-        )
+        roof_match = _ROOF_RE.search(text)
         if roof_match:
             info.roof_type = roof_match[1]
 
         # 층수
-        floors_match = re.search(r'(\d+)\s*층\s*(?:아파트|오피스텔|근린|주택|상가|업무|건물)', text)
+        floors_match = _FLOORS_RE.search(text)
         if not floors_match:
-            floors_match = re.search(r'지붕\s*(\d+)\s*층', text)
+            floors_match = _FLOORS_AFTER_ROOF_RE.search(text)
         if floors_match:
             info.floors = int(floors_match[1])
 
         # 층별 면적
-        area_patterns = [
-            r'(지하?\d+층)\s*([\d,.]+)\s*㎡',
-            r'(\d+층)\s*([\d,.]+)\s*㎡',
-            r'(옥탑\d?층?)\s*([\d,.]+)\s*㎡',
-        ]
         seen_floors = set()
-        for pat in area_patterns:
-            for m in re.finditer(pat, detail_text):
-                floor_name = m[1]
-                area_val = float(m[2].replace(',', ''))
-                if floor_name not in seen_floors:
-                    seen_floors.add(floor_name)
-                    excluded = '연면적제외' in detail_text[
-                        max(0, m.start() - 50):m.end() + 50
-                    ]
-                    info.areas.append(FloorArea(
-                        floor=floor_name, area=area_val, is_excluded=excluded
-                    ))
-
-        info.areas.sort(key=lambda x: x.floor)
+        for m in _FLOOR_AREA_RE.finditer(detail_text):
+            floor_name = m[1]
+            area_val = float(m[2].replace(',', ''))
+            if floor_name not in seen_floors:
+                seen_floors.add(floor_name)
+                excluded = detail_text.find(
+                    '연면적제외', max(0, m.start() - 50), m.end() + 50
+                ) != -1
+                info.areas.append(FloorArea(
+                    floor=floor_name, area=area_val, is_excluded=excluded
+                ))
+
+        info.areas.sort(key=_floor_sort_key)
 
     # ==================== 갑구/을구 파싱 ====================
 
@@ -1116,7 +1300,7 @@ class RegistryPDFParser:
                 continue
 
             rank = clean_text(cells[0])
-            if not rank or not re.match(r'\d', rank):
+            if not rank or not rank[0].isdecimal():
                 continue
 
             # 공동담보목록/매각물건목록/요약 행 필터링
@@ -1125,7 +1309,7 @@ class RegistryPDFParser:
             if '등기명의인' in rank:
                 break  # 주요 등기사항 요약 섹션
             purpose = clean_text(cells[1])
-            if re.match(r'\[(?:토지|건물)\]', purpose):
+            if _COLLATERAL_ITEM_RE.match(purpose):
                 continue  # 공동담보목록 항목
 
             receipt_text = clean_text(cells[2])
@@ -1160,9 +1344,10 @@ class RegistryPDFParser:
                 entry.remarks = detail_text
 
             # 말소 등기 대상 번호
-            cancels_match = re.search(r'(\d+(?:-\d+)?)번', purpose)
-            if '말소' in purpose and cancels_match:
-                entry.cancels_rank = cancels_match[1]
+            if '말소' in purpose:
+                cancels_match = _CANCELS_RANK_RE.search(purpose)
+                if cancels_match:
+                    entry.cancels_rank = cancels_match[1]
 
             entries.append(entry)
 
@@ -1180,7 +1365,7 @@ class RegistryPDFParser:
                 continue
 
             rank = clean_text(cells[0])
-            if not rank or not re.match(r'\d', rank):
+            if not rank or not rank[0].isdecimal():
                 continue
 
             # 공동담보목록/매각물건목록/요약 행 필터링
@@ -1189,7 +1374,7 @@ class RegistryPDFParser:
             if '등기명의인' in rank:
                 break  # 주요 등기사항 요약 섹션
             purpose = clean_text(cells[1])
-            if re.match(r'\[(?:토지|건물)\]', purpose):
+            if _COLLATERAL_ITEM_RE.match(purpose):
                 continue  # 공동담보목록 항목
 
             receipt_text = clean_text(cells[2])
@@ -1216,9 +1401,10 @@ class RegistryPDFParser:
             self._extract_section_b_details(entry, detail_text, cause_text)
 
             # 말소 대상
-            cancels_match = re.search(r'(\d+(?:-\d+)?)번', purpose)
-            if '말소' in purpose and cancels_match:
-                entry.cancels_rank = cancels_match[1]
+            if '말소' in purpose:
+                cancels_match = _CANCELS_RANK_RE.search(purpose)
+                if cancels_match:
+                    entry.cancels_rank = cancels_match[1]
 
             entries.append(entry)
 
@@ -1235,7 +1421,7 @@ class RegistryPDFParser:
             if not cells:
                 continue
 
-            line = ' '.join(str(c or '') for c in cells)
+            line = ' '.join([c or '' for c in cells])
             line_clean = clean_text(line)
             compact = line_clean.replace(' ', '')
 
@@ -1245,7 +1431,7 @@ class RegistryPDFParser:
 
             # 메타 정보: 목록번호
             if '목록번호' in compact:
-                m = re.search(r'(\d[\d-]+)', compact.replace('목록번호', '', 1))
+                m = _LIST_NUMBER_RE.search(compact.replace('목록번호', '', 1))
                 if m:
                     trade.list_number = m[1]
                 continue
@@ -1269,7 +1455,7 @@ class RegistryPDFParser:
 
             # 데이터 행: 일련번호(숫자)로 시작
             first = clean_text(str(cells[0] or ''))
-            if first and re.match(r'\d+$', first):
+            if first and first.isdecimal():
                 item = TradeListItem(serial_number=first)
                 if len(cells) > 1:
                     item.property_description = clean_text(str(cells[1] or ''))
@@ -1291,39 +1477,23 @@ class RegistryPDFParser:
 
     def _classify_reg_type_a(self, text: str) -> str:
         # 등기목적은 법률 복합어 — PDF 줄바꿈으로 생긴 공백 제거
-        text = clean_text(text).replace(' ', '')
+        text = compact_text(text)
         # 말소 패턴 우선
         if '말소' in text:
-            m = re.search(r'(\d+(?:-\d+)?번?\S*말소)', text)
+            m = _CANCEL_REG_TYPE_RE.search(text)
             return m[1] if m else text
-        # 구체적인 타입을 앞에 (부분문자열 오인식 방지: 소유권이전청구권가등기 > 소유권이전)
-        types = [
-            '소유권이전청구권가등기', '소유권보존', '소유권이전',
-            '가처분', '가압류', '압류',
-            '임의경매개시결정', '강제경매개시결정', '경매개시결정',
-            '등기명의인표시변경', '등기명의인표시경정',
-        ]
-        for t in types:
+        for t in _REG_TYPES_A:
             if t in text:
                 return t
         return text[:40] if len(text) > 40 else text
 
     def _classify_reg_type_b(self, text: str) -> str:
         # 등기목적은 법률 복합어 — PDF 줄바꿈으로 생긴 공백 제거
-        text = clean_text(text).replace(' ', '')
+        text = compact_text(text)
         if '말소' in text:
-            m = re.search(r'(\d+(?:-\d+)?번?\S*말소)', text)
+            m = _CANCEL_REG_TYPE_RE.search(text)
             return m[1] if m else text
-        types = [
-            '근저당권설정', '근저당권이전', '근저당권변경',
-            '근저당권부채권질권설정',
-            '근질권설정', '저당권설정',
-            '전세권설정', '전세권이전',
-            '주택임차권', '임차권설정',
-            '지상권설정', '지상권이전',
-            '가등기', '등기명의인표시변경',
-        ]
-        for t in types:
+        for t in _REG_TYPES_B:
             if t in text:
                 return t
         return text[:40] if len(text) > 40 else text
@@ -1331,25 +1501,14 @@ class RegistryPDFParser:
     def _extract_cause(self, text: str) -> str:
         """등기원인 추출"""
         text = clean_text(text)
-        # 구체적인 원인을 앞에 (부분문자열 오인식 방지: 매매예약>매매, 압류해제>해제 등)
-        causes = [
-            '매매예약', '매매', '상속', '증여', '신탁', '경락', '판결', '교환',
-            '협의분할', '법원경매', '공매', '설정계약',
-            '확정채권양도', '확정채무의면책적인수', '면책적인수', '취급지점변경',
-            '압류해제', '압류', '해지', '해제', '취하', '취소결정',
-            '전거', '행정구역변경', '도로명주소변경', '명칭변경', '주소변경',
-        ]
-        for c in causes:
-            if c in text.replace(' ', ''):
+        compact = compact_text(text)
+        for c in _CAUSES:
+            if c in compact:
                 return c
         # 법원 결정 패턴 (공백 제거 후 매칭 — PDF 줄바꿈 분절 대응, 사건번호 포함)
-        compact = text.replace(' ', '')
         # 선행 날짜를 제거하여 \w+가 날짜까지 탐욕적으로 매칭하는 것을 방지
-        compact_no_date = re.sub(r'\d{4}년\d{1,2}월\d{1,2}일', '', compact)
-        court_match = re.search(
-            r'(\w+법원\w*의\w+(?:\([^)]*\))?)',
-            compact_no_date
-        )
+        compact_no_date = _KOREAN_DATE_COMPACT_RE.sub('', compact)
+        court_match = _COURT_RE.search(compact_no_date)
         if court_match:
             return court_match[1]
         return text[:30] if text else ""
@@ -1360,11 +1519,54 @@ class RegistryPDFParser:
                                    detail: str, cause: str):
         full = detail + " " + cause
 
+        # 소유자/공유자/수탁자/가등기권자
+        self._extract_section_a_owners(entry, full)
+
+        # 채권자
+        creditor_match = _CREDITOR_RE.search(full)
+        if creditor_match:
+            rn = parse_resident_number(full, creditor_match.start())
+            addr, _ = self._extract_address_after(full, creditor_match.end())
+            entry.creditor = CreditorInfo(
+                name=creditor_match[1], resident_number=rn, address=addr
+            )
+
+        # 권리자
+        if not entry.creditor:
+            rights_match = _RIGHTS_HOLDER_RE.search(full)
+            if rights_match:
+                rn = parse_resident_number(full, rights_match.start())
+                addr, _ = self._extract_address_after(full, rights_match.end())
+                entry.creditor = CreditorInfo(
+                    name=rights_match[1], resident_number=rn, address=addr
+                )
+                # 처분청 등 추가 정보를 remarks로
+                extra = _DISPOSITION_OFFICE_RE.search(full[rights_match.end():])
+                if extra and not entry.remarks:
+                    entry.remarks = f"처분청 {clean_text(extra[1])}"
+
+        # 청구금액
+        entry.claim_amount = parse_amount(full)
+
+        # 거래가액
+        if not entry.claim_amount:
+            trade_match = _TRADE_AMOUNT_RE.search(full)
+            if trade_match:
+                entry.claim_amount = int(trade_match[1].replace(',', ''))
+
+        # 피보전권리
+        right_match = _PRESERVED_RIGHT_RE.search(full)
+        if right_match and not entry.registration_cause:
+            entry.registration_cause = clean_text(right_match[1])
+
+    def _extract_section_a_owners(self, entry: SectionAEntry, full: str):
+        """갑구 소유권 관련 인물 추출 (공유자 > 소유자 > 수탁자 > 가등기권자 순)"""
+        # 각 패턴은 아래 키워드 중 하나를 반드시 포함 — 없으면 (가압류/압류 등) 탐색 생략
+        if not ('지분' in full or '소유자' in full or '수탁자' in full or '가등기권자' in full):
+            return
+
         # 공유자/지분 패턴 (복수 공유자)
-        for m in re.finditer(
-            r'지분\s+\d+분의\s+\d+\s+(\S+)\s+([\d]{6}-[\d*]{7}|[\d]{6}-[\d]{7})',
-            full
-        ):
+        for m in _OWNER_SHARE_RE.finditer(full):
             name = m[1]
             rn = m[2]
             addr, rem = self._extract_address_after(full, m.end())
@@ -1377,10 +1579,7 @@ class RegistryPDFParser:
 
         # 소유자 (단독 소유자 — 지분 없는 경우)
         if not entry.owners:
-            for m in re.finditer(
-                r'소유자\s+(\S+)\s+([\d]{6}-[\d*]{7}|[\d]{6}-[\d]{7})',
-                full
-            ):
+            for m in _OWNER_RN_RE.finditer(full):
                 name = m[1]
                 rn = m[2]
                 addr, rem = self._extract_address_after(full, m.end())
@@ -1393,7 +1592,7 @@ class RegistryPDFParser:
 
         # 소유자 (주민번호 없는 패턴 — 법인 등)
         if not entry.owners:
-            owner_match = re.search(r'소유자\s+(\S+)', full)
+            owner_match = _OWNER_RE.search(full)
             if owner_match:
                 name = owner_match[1]
                 rn = parse_resident_number(full)
@@ -1407,7 +1606,7 @@ class RegistryPDFParser:
 
         # 수탁자
         if not entry.owners:
-            trustee_match = re.search(r'수탁자\s+(\S+)', full)
+            trustee_match = _TRUSTEE_RE.search(full)
             if trustee_match:
                 name = trustee_match[1]
                 rn = parse_resident_number(full)
@@ -1417,12 +1616,10 @@ class RegistryPDFParser:
 
         # 가등기권자 (지분 정보가 이름 앞에 올 수 있음)
         if not entry.owners:
-            provisional = re.search(
-                r'가등기권자\s+(?:지분\s+\d+분의\s+\d+\s+)?(\S+)', full
-            )
+            provisional = _PROVISIONAL_RE.search(full)
             if provisional:
                 name = provisional[1]
-                rn = parse_resident_number(full[provisional.start():])
+                rn = parse_resident_number(full, provisional.start())
                 addr, rem = self._extract_address_after(full, provisional.end())
                 entry.owners.append(OwnerInfo(
                     name=name, resident_number=rn, address=addr, role='가등기권자'
@@ -1430,45 +1627,6 @@ class RegistryPDFParser:
                 if rem and not entry.remarks:
                     entry.remarks = rem
 
-        # 채권자
-        creditor_match = re.search(r'채권자\s+(\S+)', full)
-        if creditor_match:
-            rn = parse_resident_number(
-                full[creditor_match.start():]
-            )
-            addr, _ = self._extract_address_after(full, creditor_match.end())
-            entry.creditor = CreditorInfo(
-                name=creditor_match[1], resident_number=rn, address=addr
-            )
-
-        # 권리자
-        if not entry.creditor:
-            rights_match = re.search(r'권리자\s+(\S+)', full)
-            if rights_match:
-                rn = parse_resident_number(full[rights_match.start():])
-                addr, _ = self._extract_address_after(full, rights_match.end())
-                entry.creditor = CreditorInfo(
-                    name=rights_match[1], resident_number=rn, address=addr
-                )
-                # 처분청 등 추가 정보를 remarks로
-                extra = re.search(r'처분청\s+(.+)', full[rights_match.end():])
-                if extra and not entry.remarks:
-                    entry.remarks = f"처분청 {clean_text(extra[1])}"
-
-        # 청구금액
-        entry.claim_amount = parse_amount(full)
-
-        # 거래가액
-        if not entry.claim_amount:
-            trade_match = re.search(r'거래가액\s*금\s*([\d,]+)\s*원', full)
-            if trade_match:
-                entry.claim_amount = int(trade_match[1].replace(',', ''))
-
-        # 피보전권리
-        right_match = re.search(r'피보전권리\s+(.+?)(?:채권자|금지|$)', full)
-        if right_match and not entry.registration_cause:
-            entry.registration_cause = clean_text(right_match[1])
-
     # ==================== 을구 상세 ====================
 
     def _extract_section_b_details(self, entry: SectionBEntry,
@@ -1476,34 +1634,32 @@ class RegistryPDFParser:
         full = detail + " " + cause
 
         # 채권최고액
-        entry.max_claim_amount = parse_amount(
-            re.search(r'채권최고액\s*금\s*([\d,]+)\s*원', full)[0]
-        ) if re.search(r'채권최고액\s*금\s*([\d,]+)\s*원', full) else None
+        max_claim = _MAX_CLAIM_RE.search(full)
+        entry.max_claim_amount = int(max_claim[1].replace(',', '')) if max_claim else None
 
         # 채권액 (질권 등)
         if not entry.max_claim_amount:
-            bond = re.search(r'채권액\s*금\s*([\d,]+)\s*원', full)
+            bond = _BOND_AMOUNT_RE.search(full)
             if bond:
                 entry.bond_amount = int(bond[1].replace(',', ''))
 
         # 채무자
-        debtor_match = re.search(r'채무자\s+(\S+)', full)
+        debtor_match = _DEBTOR_RE.search(full)
         if debtor_match:
             # 다음 역할 키워드까지만 탐색 (근저당권자 등의 주민번호 오인식 방지)
-            debtor_segment = re.split(
-                r'근저당권자|저당권자|채권자|권리자|전세권자|임차권자|지상권자',
-                full[debtor_match.start():]
-            )[0]
-            rn = parse_resident_number(debtor_segment)
+            stop = _DEBTOR_STOP_RE.search(full, debtor_match.start())
+            rn = parse_resident_number(
+                full, debtor_match.start(), stop.start() if stop else len(full)
+            )
             addr, _ = self._extract_address_after(full, debtor_match.end())
             entry.debtor = OwnerInfo(
                 name=debtor_match[1], resident_number=rn, address=addr
             )
 
         # 근저당권자
-        mortgagee_match = re.search(r'근저당권자\s+(\S+)', full)
+        mortgagee_match = _MORTGAGEE_RE.search(full)
         if mortgagee_match:
-            rn = parse_resident_number(full[mortgagee_match.start():])
+            rn = parse_resident_number(full, mortgagee_match.start())
             addr, _ = self._extract_address_after(full, mortgagee_match.end())
             entry.mortgagee = CreditorInfo(
                 name=mortgagee_match[1], resident_number=rn, address=addr
@@ -1511,33 +1667,33 @@ class RegistryPDFParser:
 
         # 채권자 (질권 등)
         if not entry.mortgagee:
-            creditor_match = re.search(r'채권자\s+(\S+)', full)
+            creditor_match = _CREDITOR_RE.search(full)
             if creditor_match:
-                rn = parse_resident_number(full[creditor_match.start():])
+                rn = parse_resident_number(full, creditor_match.start())
                 addr, _ = self._extract_address_after(full, creditor_match.end())
                 entry.mortgagee = CreditorInfo(
                     name=creditor_match[1], resident_number=rn, address=addr
                 )
 
         # 임차보증금
-        deposit = re.search(r'임차보증금\s*금\s*([\d,]+)\s*원', full)
+        deposit = _LEASE_DEPOSIT_RE.search(full)
         if deposit:
             entry.deposit_amount = int(deposit[1].replace(',', ''))
 
         # 전세금
-        jeonse = re.search(r'전세금\s*금\s*([\d,]+)\s*원', full)
+        jeonse = _JEONSE_RE.search(full)
         if jeonse and not entry.deposit_amount:
             entry.deposit_amount = int(jeonse[1].replace(',', ''))
 
         # 차임(월세)
-        rent = re.search(r'차\s*임\s*금?\s*([\d,]+)\s*원', full)
+        rent = _RENT_RE.search(full)
         if rent:
             entry.monthly_rent = int(rent[1].replace(',', ''))
 
         # 임차권자
-        lessee_match = re.search(r'임차권자\s+(\S+)', full)
+        lessee_match = _LESSEE_RE.search(full)
         if lessee_match:
-            rn = parse_resident_number(full[lessee_match.start():])
+            rn = parse_resident_number(full, lessee_match.start())
             entry.lessee = LesseeInfo(
                 name=lessee_match[1], resident_number=rn
             )
@@ -1545,40 +1701,40 @@ class RegistryPDFParser:
         # 임대차 기간
         if '임대차계약일자' in full or '확정일자' in full:
             lt = LeaseTermInfo()
-            contract = re.search(r'임대차계약일자\s*(\d{4}년\s*\d+월\s*\d+일)', full)
+            contract = _CONTRACT_DATE_RE.search(full)
             if contract:
                 lt.contract_date = contract[1]
-            fixed = re.search(r'확정일자\s*(\d{4}년\s*\d+월\s*\d+일)', full)
+            fixed = _FIXED_DATE_RE.search(full)
             if fixed:
                 lt.fixed_date = fixed[1]
             entry.lease_term = lt
 
         # 지상권 정보
-        purpose_match = re.search(r'목\s*적\s+(.+?)(?:범\s*위|존속|지\s*료|$)', full)
+        purpose_match = _PURPOSE_RE.search(full)
         if purpose_match:
             entry.purpose = clean_text(purpose_match[1])
-        scope_match = re.search(r'범\s*위\s+(.+?)(?:존속|지\s*료|지상권자|$)', full)
+        scope_match = _SCOPE_RE.search(full)
         if scope_match:
             entry.scope = clean_text(scope_match[1])
-        duration_match = re.search(r'존속기간\s+(.+?)(?:지\s*료|지상권자|$)', full)
+        duration_match = _DURATION_RE.search(full)
         if duration_match:
             entry.duration = clean_text(duration_match[1])
-        rent_match = re.search(r'지\s*료\s+(\S+)', full)
+        rent_match = _LAND_RENT_RE.search(full)
         if rent_match:
             entry.land_rent = rent_match[1]
 
         # 지상권자
         if not entry.mortgagee:
-            surface_match = re.search(r'지상권자\s+(\S+)', full)
+            surface_match = _SURFACE_RIGHT_HOLDER_RE.search(full)
             if surface_match:
-                rn = parse_resident_number(full[surface_match.start():])
+                rn = parse_resident_number(full, surface_match.start())
                 addr, _ = self._extract_address_after(full, surface_match.end())
                 entry.mortgagee = CreditorInfo(
                     name=surface_match[1], resident_number=rn, address=addr
                 )
 
         # 공동담보목록
-        collateral = re.search(r'공동담보목록\s+(\S+)', full)
+        collateral = _COLLATERAL_LIST_RE.search(full)
         if collateral:
             entry.collateral_list = collateral[1]
 
@@ -1590,40 +1746,30 @@ class RegistryPDFParser:
         remaining = text[pos:pos + 200]
         remarks: Optional[str] = None
         # 주소 종료 기준: 법조문, 참조번호, 날짜, 역할 키워드
-        stop = re.search(
-            r'(?:부동산|민법|상법|형법|세법|등기)\S*법\b|제\d+조|규정에\s*의하여|전산이기|'
-            r'매매목록|공동담보목록|\d{4}년\s*\d{1,2}월\s*\d{1,2}일|'
-            r'근저당권자|저당권자|채권자|채무자|소유자|공유자|권리자|'
-            r'임차권자|전세권자|지상권자|가등기권자|수탁자|처분청',
-            remaining
-        )
+        stop = _ADDRESS_STOP_RE.search(remaining)
         if stop:
             remarks_raw = clean_text(remaining[stop.start():])
             remarks = remarks_raw if remarks_raw else None
             remaining = remaining[:stop.start()].rstrip()
         # 주소 패턴: 시/도로 시작
-        addr_match = re.search(
-            r'((?:서울|부산|대구|인천|광주|대전|울산|세종|경기|강원|충청|전라|경상|제주)'
-            r'(?:특별시|광역시|특별자치시|도|특별자치도)?'
-            r'\S*(?:\s+\S+){1,8})',
-            remaining
-        )
+        addr_match = _ADDRESS_CITY_RE.search(remaining)
         if addr_match:
             return clean_text(addr_match[1]), remarks
         # 군/구 시작 패턴
-        addr_match2 = re.search(r'(\S+[군구시읍면동리]\s+\S+(?:\s+\S+){0,6})', remaining)
+        addr_match2 = _ADDRESS_DISTRICT_RE.search(remaining)
         if addr_match2:
             return clean_text(addr_match2[1]), remarks
         return None, remarks
 
     @staticmethod
     def _extract_share_near(text: str, pos: int) -> Optional[str]:
-        """지분 정보 추출"""
-        nearby = text[max(0, pos - 100):pos + 200]
-        share_match = re.search(r'(\d+)분의\s*(\d+)', nearby)
+        """지분 정보 추출 (pos 앞 100자 ~ 뒤 200자 범위)"""
+        # 공유자마다 호출되므로 범위를 잘라 복사하지 않고 같은 범위를 인덱스로 탐색
+        start, end = max(0, pos - 100), pos + 200
+        share_match = _SHARE_RE.search(text, start, end)
         if share_match:
             return f"{share_match[1]}분의 {share_match[2]}"
-        if '단독소유' in nearby:
+        if text.find('단독소유', start, end) != -1:
             return '단독소유'
         return None
 
@@ -1633,13 +1779,15 @@ class RegistryPDFParser:
         result = []
         for row_data in rows:
             cells = row_data['cells']
-            first_cell = ' '.join(str(c) for c in cells[:2] if c)
-            first_cell_clean = clean_text(first_cell)
+            first_cell = ' '.join([c for c in cells[:2] if c])
             # 섹션 제목 행 (【 】 포함)
             if '【' in first_cell or '】' in first_cell:
                 continue
-            # 컬럼 헤더 행
-            if keyword in first_cell_clean:
+            # 컬럼 헤더 행 — 키워드에 공백이 없으므로 워터마크('열람용')가
+            # 끼어 있을 때만 정리 후 다시 확인
+            if keyword in first_cell or (
+                '열' in first_cell and keyword in clean_text(first_cell)
+            ):
                 continue
             # 빈 행
             if all(not c for c in cells):
@@ -1651,63 +1799,71 @@ class RegistryPDFParser:
     def _merge_continuation_rows(rows: List[Dict]) -> List[Dict]:
         """연속 행 병합 (순위번호가 비어있으면 이전 행에 합침)"""
         merged = []
+        pending: Dict[int, List[str]] = {}
         for row_data in rows:
             cells = row_data['cells']
-            rank = clean_text(cells[0]) if cells else ""
+            # 순위번호 칸은 첫 글자와 키워드 포함 여부만 보므로 strip으로 충분하고,
+            # 워터마크('열람용')가 끼어 있을 때만 clean_text로 정리
+            rank = cells[0].strip() if cells else ""
+            if '열' in rank:
+                rank = clean_text(rank)
 
             # 다른 섹션의 컬럼 헤더/타이틀이 섞여 들어오는 경우 병합으로 데이터가 오염되는 것을 방지
-            if rank and not re.match(r"\d", rank):
-                if any(k in rank for k in (
-                    "등기명의인", "순위번호", "주요등기사항", "대상소유자",
-                    "공동담보", "매각", "매매", "목록번호", "거래가액",
-                )):
+            if rank and not rank[0].isdecimal():
+                if any(k in rank for k in _FOREIGN_HEADER_KEYWORDS):
                     continue
 
             # 순위번호가 있으면 새 항목
-            if rank and re.match(r'\d', rank):
+            if rank and rank[0].isdecimal():
+                if pending:
+                    join_cell_parts(merged[-1]['cells'], pending)
                 merged.append(row_data)
             elif merged:
-                # 이전 행에 텍스트 병합
+                # 이전 행에 텍스트 병합 (셀별 조각을 모았다가 다음 항목에서 한 번에 join)
                 prev = merged[-1]
-                for i in range(len(cells)):
-                    if i < len(prev['cells']) and cells[i]:
-                        if prev['cells'][i]:
-                            prev['cells'][i] += '\n' + cells[i]
+                prev_cells = prev['cells']
+                for i in range(min(len(cells), len(prev_cells))):
+                    if cells[i]:
+                        parts = pending.get(i)
+                        if parts is not None:
+                            parts.append(cells[i])
+                        elif prev_cells[i]:
+                            pending[i] = [prev_cells[i], cells[i]]
                         else:
-                            prev['cells'][i] = cells[i]
+                            pending[i] = [cells[i]]
                 # 말소 상태 전파
                 if row_data.get('is_cancelled'):
                     prev['is_cancelled'] = True
 
+        if pending:
+            join_cell_parts(merged[-1]['cells'], pending)
         return merged
 
     # ==================== 말소 처리 ====================
 
-    def _apply_text_cancellations(self, entries: List):
+    @staticmethod
+    def _apply_text_cancellation(entry):
         """텍스트 기반 말소 보강 (붉은 선 감지 못한 경우 대비)"""
-        for entry in entries:
-            raw = entry.raw_text or ""
-            reg_type = entry.registration_type or ""
-
-            # "X번~말소" 등기는 그 자체가 말소 등기
-            if '말소' in reg_type:
-                cancels_match = re.search(r'(\d+(?:-\d+)?)번', reg_type)
-                if cancels_match and not entry.cancels_rank:
-                    entry.cancels_rank = cancels_match[1]
-
-            # 등기원인이 해지/해제/취하/취소 → 말소 처리
-            cause = entry.registration_cause or ""
-            if cause in ('해지', '해제', '취하', '취소결정', '압류해제'):
-                if not entry.cancels_rank:
-                    cancels_match = re.search(r'(\d+(?:-\d+)?)번', reg_type)
-                    if cancels_match:
-                        entry.cancels_rank = cancels_match[1]
+        if entry.cancels_rank:
+            return
+        reg_type = entry.registration_type or ""
+        # "X번~말소" 등기는 그 자체가 말소 등기,
+        # 등기원인이 해지/해제/취하/취소인 경우도 말소 처리
+        if '말소' in reg_type or entry.registration_cause in _CANCEL_CAUSES:
+            cancels_match = _CANCELS_RANK_RE.search(reg_type)
+            if cancels_match:
+                entry.cancels_rank = cancels_match[1]
 
     def _map_cancellations(self, entries: List):
-        """말소 관계 매핑: 말소등기 → 원본등기"""
+        """말소 관계 매핑: 말소등기 → 원본등기
+
+        말소 대상 순위는 텍스트 보강과 같은 순회에서 모은다. 말소등기는 보통
+        원본등기보다 뒤에 오므로 적용은 두 번째 순회에서 한다.
+        """
         cancel_map: Dict[str, Dict] = {}
 
         for entry in entries:
+            self._apply_text_cancellation(entry)
             if entry.cancels_rank:
                 cancel_map[entry.cancels_rank] = {
                     'rank_number': entry.rank_number,
@@ -1715,9 +1871,13 @@ class RegistryPDFParser:
                     'cause': entry.registration_cause or entry.cancellation_cause,
                 }
 
+        # 말소등기가 없으면 두 번째 순회 생략
+        if not cancel_map:
+            return
+
         for entry in entries:
-            if entry.rank_number in cancel_map:
-                info = cancel_map[entry.rank_number]
+            info = cancel_map.get(entry.rank_number)
+            if info is not None:
                 entry.is_cancelled = True
                 entry.cancelled_by_rank = info['rank_number']
                 entry.cancellation_date = info['date']
@@ -1740,11 +1900,11 @@ class RegistryPDFParser:
         if summary_start >= 0:
             header = self.raw_text[summary_start:summary_start + 500]
             # 고유번호
-            un_match = re.search(r'고유번호\s*[:：]?\s*([\d\s-]+)', header)
+            un_match = _SUMMARY_UNIQUE_NUMBER_RE.search(header)
             if un_match:
-                summary.unique_number = re.sub(r'\s+', '', un_match[1]).strip()
+                summary.unique_number = "".join(un_match[1].split())
             # [토지/건물/집합건물] 소재지
-            pt_match = re.search(r'\[(토지|건물|집합건물)\]\s*(.+?)(?:\n|$)', header)
+            pt_match = _SUMMARY_PROPERTY_RE.search(header)
             if pt_match:
                 summary.property_type = pt_match[1]
                 summary.address = clean_text(pt_match[2])
@@ -1794,7 +1954,7 @@ class RegistryPDFParser:
             summary_text = clean_text(cells[3])
             target_owner = clean_text(cells[4])
 
-            if not rank or not re.match(r"\d", rank):
+            if not rank or not rank[0].isdecimal():
                 continue
 
             receipt_date, receipt_number = extract_receipt_info(receipt_info)
@@ -1818,31 +1978,21 @@ class RegistryPDFParser:
     @staticmethod
     def _parse_summary_right_detail(entry: MajorSummaryRightEntry, text: str):
         """요약 텍스트에서 구조화된 필드를 추출한다."""
-        # 채권최고액
-        m = re.search(r'채권최고액\s*(금\s*[\d,]+\s*원)', text)
-        if m:
-            entry.max_claim_amount = parse_amount(m[1])
-
-        # 채권액
-        m = re.search(r'채권액\s*(금\s*[\d,]+\s*원)', text)
-        if m:
-            entry.bond_amount = parse_amount(m[1])
-
-        # 보증금/전세금
-        m = re.search(r'(?:보증금|전세금)\s*(금\s*[\d,]+\s*원)', text)
-        if m:
-            entry.deposit_amount = parse_amount(m[1])
+        # 채권최고액 / 채권액 / 보증금·전세금 — 필드별 첫 매칭만 사용
+        filled = set()
+        for m in _SUMMARY_AMOUNT_RE.finditer(text):
+            field_name = _SUMMARY_AMOUNT_FIELDS[m[1]]
+            if field_name not in filled:
+                filled.add(field_name)
+                setattr(entry, field_name, parse_amount(m[2]))
 
         # 목적 (지상권 등) — "목 적" 뒤 ~ 권리자 키워드 전까지
-        m = re.search(r'목\s*적\s+(.+?)(?:지상권자|전세권자|임차권자|채권자|근저당권자|$)', text)
+        m = _SUMMARY_PURPOSE_RE.search(text)
         if m:
             entry.purpose = clean_text(m[1])
 
         # 권리자 (근저당권자, 채권자, 지상권자, 전세권자 등)
-        m = re.search(
-            r'(?:근저당권자|저당권자|채권자|지상권자|전세권자|임차권자|권리자)\s+(\S+)',
-            text
-        )
+        m = _SUMMARY_CREDITOR_RE.search(text)
         if m:
             entry.creditor = m[1]
 
@@ -1860,15 +2010,13 @@ def parse_registry_pdf(pdf_buffer: bytes) -> Dict[str, Any]:
 
     result = to_dict(data)
 
-    # 통계 추가
-    result['section_a_count'] = len(result.get('section_a', []))
-    result['section_b_count'] = len(result.get('section_b', []))
-    result['active_section_a_count'] = sum(
-        1 for e in result.get('section_a', []) if not e.get('is_cancelled')
-    )
-    result['active_section_b_count'] = sum(
-        1 for e in result.get('section_b', []) if not e.get('is_cancelled')
-    )
+    # 통계 추가 (len은 O(1) — 유효 건수만 섹션당 한 번 순회)
+    section_a = result.get('section_a', [])
+    section_b = result.get('section_b', [])
+    result['section_a_count'] = len(section_a)
+    result['section_b_count'] = len(section_b)
+    result['active_section_a_count'] = sum(not e.get('is_cancelled') for e in section_a)
+    result['active_section_b_count'] = sum(not e.get('is_cancelled') for e in section_b)
 
     logger.info(
         "파싱 완료 | {} | 갑구 {}건(유효 {}) 을구 {}건(유효 {})",
@@ -1902,18 +2050,13 @@ class RegistryParserV1_0_1(BaseParser):
     def can_parse(cls, pdf_buffer: bytes, text_sample: str) -> float:
         """등기부등본 PDF인지 판별"""
         score = 0.0
-        indicators = [
-            ('고유번호', 0.3),
-            ('표제부', 0.2),
-            ('갑구', 0.2),
-            ('을구', 0.1),
-            ('등기부등본', 0.15),
-            ('[토지]', 0.05), ('[건물]', 0.05), ('[집합건물]', 0.05),
-        ]
-        for keyword, weight in indicators:
+        for keyword, weight in _CAN_PARSE_INDICATORS:
             if keyword in text_sample:
                 score += weight
-        return min(score, 1.0)
+                # 점수는 증가만 하므로 1.0에 도달하면 나머지 키워드는 볼 필요 없음
+                if score >= 1.0:
+                    return 1.0
+        return score
 
     def parse(self, pdf_buffer: bytes) -> ParseResult:
         """PDF 파싱 → ParseResult 반환"""
@@ -1931,31 +2074,28 @@ class RegistryParserV1_0_1(BaseParser):
         )
 
     def mask_for_demo(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """등기부등본 전용 데모 마스킹"""
-        masked = copy.deepcopy(data)
+        """등기부등본 전용 데모 마스킹
+
+        원본은 변경하지 않는다. 전체 deepcopy 대신 마스킹으로 값이 바뀌는
+        하위 dict만 복사하고, 나머지(raw_text 등)는 원본과 공유한다.
+        """
+        masked = dict(data)
 
         # 표제부 면적은 첫 층만
         if 'title_info' in masked and 'areas' in masked['title_info']:
+            masked['title_info'] = dict(masked['title_info'])
             masked['title_info']['areas'] = masked['title_info']['areas'][:1]
 
         # 갑구 첫 항목만, 개인정보 마스킹
         if 'section_a' in masked and masked['section_a']:
-            first_entry = masked['section_a'][0]
+            first_entry = dict(masked['section_a'][0])
             if first_entry.get('owner'):
-                owner = first_entry['owner']
-                if owner.get('name'):
-                    name = owner['name']
-                    owner['name'] = (
-                        name[0] + '*' * (len(name) - 2) + name[-1]
-                        if len(name) > 2 else name[0] + '*'
-                    )
-                owner['resident_number'] = '******-*******'
-                owner['address'] = '***' if owner.get('address') else None
+                first_entry['owner'] = mask_owner(first_entry['owner'])
             masked['section_a'] = [first_entry]
 
         # 을구 첫 항목만, 금액 숨김
         if 'section_b' in masked and masked['section_b']:
-            first_entry = masked['section_b'][0]
+            first_entry = dict(masked['section_b'][0])
             first_entry['max_claim_amount'] = None
             first_entry['deposit_amount'] = None
             first_entry['mortgagee'] = None
@@ -1964,17 +2104,18 @@ class RegistryParserV1_0_1(BaseParser):
 
         # 주요 등기사항 요약(참고용) 마스킹
         if masked.get('major_summary'):
-            ms = masked['major_summary']
+            ms = masked['major_summary'] = dict(masked['major_summary'])
             owners = ms.get('owners') or []
             if owners:
-                for o in owners[:1]:
+                owners = [dict(owners[0])]
+                for o in owners:
                     if o.get('resident_number'):
                         o['resident_number'] = '******'
                     if o.get('address'):
                         o['address'] = (o['address'][:5] + '...') if len(o['address']) > 5 else o['address']
                     if o.get('name'):
                         o['name'] = o['name'][0] + '*'
-                ms['owners'] = owners[:1]
+                ms['owners'] = owners
 
             rights = ms.get('rights') or []
             if rights:
@@ -61,61 +61,61 @@ def fmt_credits(credits: int) -> str:
 
 def print_table(headers: list, rows: list, col_widths: list = None):
     """간단한 테이블 출력"""
+    # 셀은 한 번만 문자열로 바꿔 폭 계산과 출력에 같이 사용
+    str_headers = [str(h) for h in headers]
+    str_rows = [[str(c) for c in r] for r in rows]
     if not col_widths:
-        col_widths = [max(len(str(h)), max((len(str(r[i])) for r in rows), default=0)) + 2
-                      for i, h in enumerate(headers)]
-
-    header_line = "".join(str(h).ljust(w) for h, w in zip(headers, col_widths))
+        col_widths = [len(h) for h in str_headers]
+        for r in str_rows:
+            for i in range(len(col_widths)):
+                if len(r[i]) > col_widths[i]:
+                    col_widths[i] = len(r[i])
+        col_widths = [w + 2 for w in col_widths]
+
+    header_line = "".join(h.ljust(w) for h, w in zip(str_headers, col_widths))
     print(header_line)
     print("-" * len(header_line))
-    for row in rows:
-        print("".join(str(c).ljust(w) for c, w in zip(row, col_widths)))
+    for row in str_rows:
+        print("".join(c.ljust(w) for c, w in zip(row, col_widths)))
 
 
 # ==================== 명령어 ====================
 
 async def cmd_stats():
     """서비스 현황 요약"""
-    async with get_db_session() as s:
-        # 사용자 통계
-        total_users = (await s.execute(select(func.count(User.id)))).scalar()
-        active_users = (await s.execute(
-            select(func.count(User.id)).where(User.is_active == True)
-        )).scalar()
-        plan_counts = {}
-        for plan in PlanType:
-            cnt = (await s.execute(
-                select(func.count(User.id)).where(User.plan == plan, User.is_active == True)
-            )).scalar()
-            plan_counts[plan.value] = cnt
+    today = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+    month_start = today.replace(day=1)
 
-        # 오늘 파싱
-        today = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
-        today_parses = (await s.execute(
-            select(func.count(ParseRecord.id)).where(ParseRecord.created_at >= today)
-        )).scalar()
-
-        # 이번 달 파싱
-        month_start = today.replace(day=1)
-        month_parses = (await s.execute(
-            select(func.count(ParseRecord.id)).where(ParseRecord.created_at >= month_start)
-        )).scalar()
-
-        # 전체 파싱
-        total_parses = (await s.execute(select(func.count(ParseRecord.id)))).scalar()
-
-        # 이번 달 매출
-        month_revenue = (await s.execute(
-            select(func.sum(Payment.amount)).where(
-                Payment.status == PaymentStatus.COMPLETED,
-                Payment.paid_at >= month_start
+    async with get_db_session() as s:
+        # 사용자 통계 (전체/활성 수는 FILTER 집계로 한 번에)
+        total_users, active_users = (await s.execute(
+            select(func.count(User.id), func.count(User.id).filter(User.is_active == True))
+        )).one()
+        active_by_plan = dict((await s.execute(
+            select(User.plan, func.count(User.id))
+            .where(User.is_active == True)
+            .group_by(User.plan)
+        )).all())
+        plan_counts = {plan.value: active_by_plan.get(plan, 0) for plan in PlanType}
+
+        # 파싱: 오늘 / 이번 달 / 전체
+        today_parses, month_parses, total_parses = (await s.execute(
+            select(
+                func.count(ParseRecord.id).filter(ParseRecord.created_at >= today),
+                func.count(ParseRecord.id).filter(ParseRecord.created_at >= month_start),
+                func.count(ParseRecord.id),
             )
-        )).scalar() or 0
-
-        # 전체 매출
-        total_revenue = (await s.execute(
-            select(func.sum(Payment.amount)).where(Payment.status == PaymentStatus.COMPLETED)
-        )).scalar() or 0
+        )).one()
+
+        # 매출: 이번 달 / 전체
+        month_revenue, total_revenue = (await s.execute(
+            select(
+                func.sum(Payment.amount).filter(Payment.paid_at >= month_start),
+                func.sum(Payment.amount),
+            ).where(Payment.status == PaymentStatus.COMPLETED)
+        )).one()
+        month_revenue = month_revenue or 0
+        total_revenue = total_revenue or 0
 
     print("=== 서비스 현황 ===\n")
 
@@ -172,27 +172,21 @@ async def cmd_user_detail(email: str):
             print(f"사용자를 찾을 수 없습니다: {email}")
             sys.exit(1)
 
-        # 오늘 파싱 횟수
+        # 오늘/전체 파싱 횟수 + 결제 합계 (한 세션에서는 쿼리를 동시에 보낼 수 없으므로 한 쿼리로)
         today = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
-        today_count = (await s.execute(
-            select(func.count(ParseRecord.id)).where(
-                ParseRecord.user_id == user.id,
-                ParseRecord.created_at >= today
-            )
-        )).scalar()
-
-        # 전체 파싱 횟수
-        total_parses = (await s.execute(
-            select(func.count(ParseRecord.id)).where(ParseRecord.user_id == user.id)
-        )).scalar()
-
-        # 결제 합계
-        total_paid = (await s.execute(
-            select(func.sum(Payment.amount)).where(
-                Payment.user_id == user.id,
-                Payment.status == PaymentStatus.COMPLETED
-            )
-        )).scalar() or 0
+        paid_sum = (
+            select(func.sum(Payment.amount))
+            .where(Payment.user_id == user.id, Payment.status == PaymentStatus.COMPLETED)
+            .scalar_subquery()
+        )
+        today_count, total_parses, total_paid = (await s.execute(
+            select(
+                func.count(ParseRecord.id).filter(ParseRecord.created_at >= today),
+                func.count(ParseRecord.id),
+                paid_sum,
+            ).where(ParseRecord.user_id == user.id)
+        )).one()
+        total_paid = total_paid or 0
 
         # 최근 파싱 5건
         recent_parses = (await s.execute(
@@ -341,8 +335,12 @@ async def cmd_parses(days: int = 1):
     """최근 파싱 기록"""
     since = datetime.utcnow() - timedelta(days=days)
     async with get_db_session() as s:
+        # 출력에 쓰는 컬럼만 조회 (ParseRecord 전체, 특히 result_json을 싣지 않도록)
         result = await s.execute(
-            select(ParseRecord, User.email)
+            select(
+                ParseRecord.created_at, User.email, ParseRecord.status,
+                ParseRecord.file_name, ParseRecord.property_address, ParseRecord.processing_time,
+            )
             .join(User, ParseRecord.user_id == User.id)
             .where(ParseRecord.created_at >= since)
             .order_by(desc(ParseRecord.created_at))
@@ -356,12 +354,12 @@ async def cmd_parses(days: int = 1):
 
     headers = ["일시", "사용자", "상태", "파일명", "주소", "처리시간"]
     rows = []
-    for record, email in rows_raw:
-        addr = (record.property_address or "")[:25]
-        time_str = f"{record.processing_time:.1f}s" if record.processing_time else "-"
+    for created_at, email, status, file_name, property_address, processing_time in rows_raw:
+        addr = (property_address or "")[:25]
+        time_str = f"{processing_time:.1f}s" if processing_time else "-"
         rows.append([
-            fmt_date(record.created_at), email[:20],
-            record.status.value, record.file_name[:20], addr, time_str
+            fmt_date(created_at), email[:20],
+            status.value, file_name[:20], addr, time_str
         ])
 
     print(f"최근 {days}일 파싱 기록 ({len(rows)}건):\n")
@@ -372,8 +370,13 @@ async def cmd_payments(days: int = 30):
     """결제 내역"""
     since = datetime.utcnow() - timedelta(days=days)
     async with get_db_session() as s:
+        # 출력에 쓰는 컬럼만 조회
         result = await s.execute(
-            select(Payment, User.email)
+            select(
+                Payment.paid_at, Payment.created_at, User.email, Payment.plan_name,
+                Payment.amount, Payment.status, Payment.card_company, Payment.card_number,
+                Payment.method,
+            )
             .join(User, Payment.user_id == User.id)
             .where(Payment.created_at >= since)
             .order_by(desc(Payment.created_at))
@@ -387,10 +390,10 @@ async def cmd_payments(days: int = 30):
 
     headers = ["일시", "사용자", "플랜", "금액", "상태", "결제수단"]
     rows = []
-    for pay, email in rows_raw:
+    for pay in rows_raw:
         method = f"{pay.card_company or ''} {pay.card_number or ''}".strip() or pay.method or "-"
         rows.append([
-            fmt_date(pay.paid_at or pay.created_at), email[:20],
+            fmt_date(pay.paid_at or pay.created_at), pay.email[:20],
             pay.plan_name, f"{pay.amount:,}원", pay.status.value, method[:15]
         ])
 
@@ -405,53 +408,52 @@ async def cmd_revenue():
 
         print("=== 매출 요약 ===\n")
 
-        # 월별 매출 (최근 6개월)
+        # 월별 매출 (최근 6개월) — 월 구간별 건수/합계를 FILTER 집계로 한 번에 조회
         headers = ["월", "건수", "매출"]
-        rows = []
+        months = []
         for i in range(6):
             m_start = (now.replace(day=1) - timedelta(days=30 * i)).replace(day=1, hour=0, minute=0, second=0, microsecond=0)
             if i == 0:
                 m_end = now
             else:
                 m_end = (m_start + timedelta(days=32)).replace(day=1)
+            months.append((m_start, m_end))
+
+        columns = []
+        for m_start, m_end in months:
+            in_month = and_(Payment.paid_at >= m_start, Payment.paid_at < m_end)
+            columns.append(func.count(Payment.id).filter(in_month))
+            columns.append(func.sum(Payment.amount).filter(in_month))
+        totals = (await s.execute(
+            select(*columns).where(
+                Payment.status == PaymentStatus.COMPLETED,
+                Payment.paid_at >= min(m_start for m_start, _ in months)
+            )
+        )).one()
 
-            count = (await s.execute(
-                select(func.count(Payment.id)).where(
-                    Payment.status == PaymentStatus.COMPLETED,
-                    Payment.paid_at >= m_start,
-                    Payment.paid_at < m_end
-                )
-            )).scalar() or 0
-
-            amount = (await s.execute(
-                select(func.sum(Payment.amount)).where(
-                    Payment.status == PaymentStatus.COMPLETED,
-                    Payment.paid_at >= m_start,
-                    Payment.paid_at < m_end
-                )
-            )).scalar() or 0
-
+        rows = []
+        for i, (m_start, _) in enumerate(months):
+            count = totals[2 * i] or 0
+            amount = totals[2 * i + 1] or 0
             rows.append([m_start.strftime("%Y-%m"), count, f"{amount:,}원"])
 
         print_table(headers, rows)
 
         # 플랜별 매출
         print(f"\n[플랜별 누적 매출]")
+        by_plan = {
+            plan: (count, amount)
+            for plan, count, amount in (await s.execute(
+                select(Payment.plan_type, func.count(Payment.id), func.sum(Payment.amount))
+                .where(Payment.status == PaymentStatus.COMPLETED)
+                .group_by(Payment.plan_type)
+            )).all()
+        }
         for plan in PlanType:
             if plan == PlanType.FREE:
                 continue
-            amount = (await s.execute(
-                select(func.sum(Payment.amount)).where(
-                    Payment.status == PaymentStatus.COMPLETED,
-                    Payment.plan_type == plan
-                )
-            )).scalar() or 0
-            count = (await s.execute(
-                select(func.count(Payment.id)).where(
-                    Payment.status == PaymentStatus.COMPLETED,
-                    Payment.plan_type == plan
-                )
-            )).scalar() or 0
+            count, amount = by_plan.get(plan, (0, 0))
+            amount = amount or 0
             label = settings.PRICING[plan.value]["name"]
             print(f"  {label}: {count}건, {amount:,}원")
 
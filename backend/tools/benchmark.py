@@ -12,6 +12,7 @@ Usage:
   python tools/benchmark.py --type registry --parser v1.0.0 # 특정 파서
   python tools/benchmark.py --list                         # 파서 목록
   python tools/benchmark.py --all-parsers                  # 전 버전 비교
+  python tools/benchmark.py -j 4                           # PDF 4개씩 병렬 실행 (기본: 순차)
 """
 import os
 import sys
@@ -19,6 +20,8 @@ import re
 import json
 import glob
 import argparse
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
 from datetime import datetime
 from collections import Counter
@@ -326,8 +329,13 @@ def benchmark_single(pdf_path: str, parser: BaseParser) -> PDFScore:
 
 
 def run_benchmark(pdf_paths: List[str], parser: BaseParser,
-                  document_type: str = "registry") -> BenchmarkReport:
-    """전체 벤치마크 실행"""
+                  document_type: str = "registry", workers: int = 1) -> BenchmarkReport:
+    """전체 벤치마크 실행
+
+    workers > 1이면 PDF별 벤치마크를 프로세스 풀에서 병렬 실행한다.
+    (파일 간 공유 상태가 없으며, 결과 순서는 순차 실행과 같다.
+    다만 프로세스끼리 CPU를 나눠 쓰므로 실행 시간은 순차 실행과 비교할 수 없다)
+    """
     report = BenchmarkReport(
         document_type=document_type,
         parser_version=parser.parser_version(),
@@ -335,9 +343,14 @@ def run_benchmark(pdf_paths: List[str], parser: BaseParser,
         file_count=len(pdf_paths),
     )
 
-    for path in sorted(pdf_paths):
-        score = benchmark_single(path, parser)
-        report.scores.append(score)
+    paths = sorted(pdf_paths)
+    if workers > 1 and len(paths) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(paths))) as ex:
+            report.scores.extend(ex.map(benchmark_single, paths, repeat(parser)))
+    else:
+        for path in paths:
+            score = benchmark_single(path, parser)
+            report.scores.append(score)
 
     if report.scores:
         valid = [s for s in report.scores if s.gt_tokens > 0]
@@ -499,8 +512,15 @@ def main():
     ap.add_argument("--all-parsers", action="store_true", help="전 버전 순차 비교")
     ap.add_argument("--list", action="store_true", help="파서 목록")
     ap.add_argument("--upload-dir", default=DEFAULT_UPLOAD_DIR, help="PDF 디렉토리")
+    ap.add_argument("--workers", "-j", type=int, default=1,
+                    help="병렬 프로세스 수 (기본: 1, 순차). 2 이상이면 프로세스끼리 CPU를 "
+                         "나눠 쓰므로 실행 시간은 순차 실행 기록과 비교할 수 없음 (--save 불가)")
     args = ap.parse_args()
 
+    # 히스토리는 이후 실행의 비교 기준이므로 순차 실행 결과만 저장
+    if args.save and args.workers > 1:
+        ap.error("--save는 순차 실행(--workers 1)에서만 사용할 수 있습니다")
+
     # --list
     if args.list:
         print("등록된 문서 타입:")
@@ -528,7 +548,8 @@ def main():
     if args.all_parsers:
         for ver in list_versions(args.type):
             p = get_parser(args.type, ver)
-            report = run_benchmark(pdf_paths, parser=p, document_type=args.type)
+            report = run_benchmark(pdf_paths, parser=p, document_type=args.type,
+                                   workers=args.workers)
             print_report(report, verbose=args.verbose)
             if args.save:
                 save_to_json(report)
@@ -536,7 +557,8 @@ def main():
 
     # 단일 실행
     p = get_parser(args.type, args.parser)
-    report = run_benchmark(pdf_paths, parser=p, document_type=args.type)
+    report = run_benchmark(pdf_paths, parser=p, document_type=args.type,
+                           workers=args.workers)
 
     if args.json:
         print_json(report)